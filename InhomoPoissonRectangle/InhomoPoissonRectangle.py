@@ -10,8 +10,12 @@
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # For plotting
-from scipy.optimize import minimize  # For optimizing
-from scipy import integrate  # For integrating
+import sys, os  # for finding the code in the PoissonLargeMean folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonLargeMean'));
+from funPoissonEmpPMF import funPoissonEmpPMF # type: ignore
+from funInhomoPoissonThinning import funInhomoPoissonThinning # type: ignore
+from funLambdaMax import getLambdaMax # type: ignore
+from funIntegrateRectangle import getIntegralRectangle # type: ignore
 
 plt.close('all');  # close all figures
 
@@ -25,6 +29,8 @@ yDelta = yMax - yMin;  # rectangle dimensions
 areaTotal = xDelta * yDelta;
 
 numbSim = 10 ** 3;  # number of simulations
+booleBatch = True;  # simulate (and thin) all simulations at once instead of a for-loop
+numbCellMax = None;  # cells with local upper bounds of lambda for thinning (None for lambdaMax only)
 
 s = 0.5;  # scale parameter
 
@@ -36,19 +42,10 @@ def fun_lambda(x, y):
 
 ###START -- find maximum lambda -- START ###
 # For an intensity function lambda, given by function fun_lambda,
-# finds the maximum of lambda in a rectangular region given by
-# [xMin,xMax,yMin,yMax].
-def fun_Neg(x):
-    return -fun_lambda(x[0], x[1]);  # negative of lambda
-#fun_Neg = lambda x: -fun_lambda(x[0], x[1]);  # negative of lambda
-
-xy0 = [(xMin + xMax) / 2, (yMin + yMax) / 2];  # initial value(ie centre)
-# Find largest lambda value
-resultsOpt = minimize(fun_Neg, xy0, bounds=((xMin, xMax), (yMin, yMax)));
-lambdaNegMin = resultsOpt.fun;  # retrieve minimum value found by minimize
-lambdaMax = -lambdaNegMin;
-
-
+# finds (an upper bound of) the maximum of lambda in a rectangular region
+# given by [xMin,xMax,yMin,yMax], using a grid of values refined with
+# local searches (see funLambdaMax.py).
+lambdaMax = getLambdaMax(fun_lambda, [xMin, xMax, yMin, yMax]);
 ###END -- find maximum lambda -- END ###
 
 # define thinning probability function
@@ -56,24 +53,31 @@ def fun_p(x, y):
     return fun_lambda(x, y) / lambdaMax;
 #fun_p = lambda x, y: fun_lambda(x, y) / lambdaMax;
 
-# for collecting statistics -- set numbSim=1 for one simulation
-numbPointsRetained = np.zeros(numbSim);  # vector to record number of points
-for ii in range(numbSim):
-    # Simulate a Poisson point process
-    numbPoints = np.random.poisson(areaTotal * lambdaMax);  # Poisson number of points
-    xx = np.random.uniform(0, xDelta, ((numbPoints, 1))) + xMin;  # x coordinates of Poisson points
-    yy = np.random.uniform(0, yDelta, ((numbPoints, 1))) + yMin;  # y coordinates of Poisson points
-
-    # calculate spatially-dependent thinning probabilities
-    p = fun_p(xx, yy);
-
-    # Generate Bernoulli variables (ie coin flips) for thinning
-    booleRetained = np.random.uniform(0, 1, ((numbPoints, 1))) < p;  # points to be retained
-
-    # x/y locations of retained points
-    xxRetained = xx[booleRetained];
-    yyRetained = yy[booleRetained];
-    numbPointsRetained[ii] = xxRetained.size;
+if booleBatch:
+    # all simulations at once (retained points in a PoissonEnsemble)
+    windowSim = [xMin, xMax, yMin, yMax];
+    ppEnsemble = funInhomoPoissonThinning(numbSim, fun_lambda, lambdaMax, windowSim, numbCellMax=numbCellMax);
+    numbPointsRetained = ppEnsemble.numbPoints;  # vector of number of points
+    xxRetained, yyRetained = ppEnsemble[-1];  # last simulation (for plotting)
+else:
+    # for collecting statistics -- set numbSim=1 for one simulation
+    numbPointsRetained = np.zeros(numbSim);  # vector to record number of points
+    for ii in range(numbSim):
+        # Simulate a Poisson point process
+        numbPoints = np.random.poisson(areaTotal * lambdaMax);  # Poisson number of points
+        xx = np.random.uniform(0, xDelta, ((numbPoints, 1))) + xMin;  # x coordinates of Poisson points
+        yy = np.random.uniform(0, yDelta, ((numbPoints, 1))) + yMin;  # y coordinates of Poisson points
+
+        # calculate spatially-dependent thinning probabilities
+        p = fun_p(xx, yy);
+
+        # Generate Bernoulli variables (ie coin flips) for thinning
+        booleRetained = np.random.uniform(0, 1, ((numbPoints, 1))) < p;  # points to be retained
+
+        # x/y locations of retained points
+        xxRetained = xx[booleRetained];
+        yyRetained = yy[booleRetained];
+        numbPointsRetained[ii] = xxRetained.size;
 
 # Plotting
 plt.scatter(xxRetained, yyRetained, edgecolor='b', facecolor='none', alpha=0.5);
@@ -83,8 +87,7 @@ plt.ylabel('y');
 # run empirical test on number of points generated
 if numbSim >= 10:
     # total mean measure (average number of points)
-    LambdaNumerical = integrate.dblquad(fun_lambda, xMin, xMax, lambda x: yMin, lambda y: yMax)[0];
-    # Test: as numbSim increases, numbPointsMean converges to LambdaNumerical
-    numbPointsMean = np.mean(numbPointsRetained);
-    # Test: as numbSim increases, numbPointsVar converges to LambdaNumerical
-    numbPointsVar = np.var(numbPointsRetained);
+    LambdaNumerical, _ = getIntegralRectangle(fun_lambda, [xMin, xMax, yMin, yMax]);
+    # empirical distribution (using a bincount), mean and variance of number of points
+    # Test: as numbSim increases, numbPointsMean and numbPointsVar converge to LambdaNumerical
+    nValues, pmfEmp, numbPointsMean, numbPointsVar, _ = funPoissonEmpPMF(numbPointsRetained);
@@ -0,0 +1,120 @@
+# This code simulates many ensembles (or realizations) of an inhomogeneous
+# Poisson point process on a rectangle by thinning, where all the ensembles
+# are simulated at once, in the style of Method A in PoissonFast.py.
+#
+# First all the ensembles of a homogeneous Poisson point process with
+# intensity lambdaMax are simulated in one step (see funPoissonFastA.py),
+# giving flat arrays of all the points. The intensity function fun_lambda is
+# then evaluated once on all the points, and all the points are thinned
+# with one array of uniform variables, retaining each point with
+# probability fun_lambda(x,y)/lambdaMax. The retained points stay in the
+# order of their ensembles, so they are returned as a PoissonEnsemble with
+# the number of retained points of each ensemble.
+#
+# If numbCellMax is given, the homogeneous Poisson point process is
+# replaced with a piecewise-homogeneous one, which has a constant intensity
+# on each of (at least) numbCellMax cells equal to an upper bound of
+# fun_lambda on the cell (see funLambdaCells.py), and lambdaMax is not used.
+# Each point is then retained with probability fun_lambda(x,y)/lambdaCell,
+# where lambdaCell is the bound of its cell. The retained points have the
+# same distribution, but fewer points are thinned when fun_lambda has
+# peaks. For example, for the intensity function in PoissonCheck.py (with
+# an integral of 120), the mass of the dominating Poisson point process
+# falls from about 404 to 185 with 64 cells, so about 2.2 times fewer points
+# are simulated and thinned.
+#
+# The homogeneous points and the thinning use their own random number
+# streams, which are spawned from a single seed.
+#
+# INPUT:
+# numbSim is the number of simulations (ie ensembles).
+# fun_lambda is the intensity function, which must accept arrays of x and y.
+# lambdaMax is an upper bound of fun_lambda on the rectangle (None to find it
+# with getLambdaMax in funLambdaMax.py), which is not used with cells.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular simulation window.
+# seedRand is the random seed (None to use a seed from the computer).
+# dtypeCoord is the data type of the coordinates.
+# numbCellMax is the number of cells of the piecewise-homogeneous Poisson
+# point process (None to use a homogeneous one).
+# OUTPUT:
+# ppEnsemble is a PoissonEnsemble with the x/y coordinates of the retained
+# points of all ensembles.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import sys, os  # for finding the code in the PoissonFast folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonFast'));
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+from funPoissonFastA import funPoissonFastA, funStreamsRand # type: ignore
+from funEnsembleReduce import funEnsembleCount # type: ignore
+from funLambdaCells import funLambdaCells # type: ignore
+from funLambdaMax import getLambdaMax # type: ignore
+
+# all ensembles of a piecewise-homogeneous Poisson point process with
+# intensity lambdaCell on the cells cellsRect, where the Poisson number of
+# points of each ensemble has the total mass, and each point is placed in a
+# cell with probability proportional to the mass of the cell (so the memory
+# used is proportional to the number of points, not to numbSim*numbCell)
+def funPoissonCells(numbSim, cellsRect, lambdaCell, seedRand=None, dtypeCoord=np.float64):
+    numbCell = lambdaCell.size;
+    xLow, xHigh, yLow, yHigh = (cellsRect[:, ii] for ii in range(4));
+    massCell = lambdaCell * (xHigh - xLow) * (yHigh - yLow);  # mass of each cell
+    massTotal = np.sum(massCell);
+
+    rngN, rngX, rngY = funStreamsRand(seedRand);
+    numbPoints = rngN.poisson(massTotal, numbSim);  # Poisson number of points
+    numbPointsTotal = int(np.sum(numbPoints));
+    # cell of each point
+    indexCell = rngN.choice(numbCell, size=numbPointsTotal, p=massCell / massTotal);
+
+    # position points uniformly in their cells
+    xx = rngX.random(numbPointsTotal, dtype=dtypeCoord);
+    xx *= (xHigh - xLow)[indexCell];
+    xx += xLow[indexCell];  # x coordinates of Poisson points
+    yy = rngY.random(numbPointsTotal, dtype=dtypeCoord);
+    yy *= (yHigh - yLow)[indexCell];
+    yy += yLow[indexCell];  # y coordinates of Poisson points
+    return PoissonEnsemble(numbPoints, xx, yy), indexCell;
+#end function
+
+def funInhomoPoissonThinning(numbSim, fun_lambda, lambdaMax, windowSim, seedRand=None,
+                             dtypeCoord=np.float64, numbCellMax=None):
+    if isinstance(seedRand, np.random.SeedSequence):
+        seedSeq = seedRand;
+    else:
+        seedSeq = np.random.SeedSequence(seedRand);
+    #end if-statement
+    seedPoints, seedThin = seedSeq.spawn(2);
+
+    # Simulate all ensembles of the dominating Poisson point process
+    if numbCellMax is None:
+        if lambdaMax is None:
+            lambdaMax = getLambdaMax(fun_lambda, windowSim);
+        #end if-statement
+        ppDominate = funPoissonFastA(numbSim, lambdaMax, windowSim, seedPoints, dtypeCoord);
+        lambdaDominate = lambdaMax;
+    else:
+        cellsRect, lambdaCell = funLambdaCells(fun_lambda, windowSim, numbCellMax);
+        ppDominate, indexCell = funPoissonCells(numbSim, cellsRect, lambdaCell, seedPoints, dtypeCoord);
+        lambdaDominate = lambdaCell[indexCell];  # intensity at each point
+    #end if-statement
+    xx = ppDominate.xx;
+    yy = ppDominate.yy;
+
+    # calculate spatially-dependent thinning probabilities (for all points)
+    p = fun_lambda(xx, yy) / lambdaDominate;
+    if (numbCellMax is not None) and np.any(p > 1):
+        raise ValueError('Intensity function is larger than the upper bound of a cell.');
+    #end if-statement
+
+    # Generate Bernoulli variables (ie coin flips) for thinning
+    rngThin = np.random.default_rng(seedThin);
+    booleRetained = rngThin.random(ppDominate.numbPointsTotal) < p;  # points to be retained
+
+    # number of retained points in each ensemble and their x/y locations
+    numbPointsRetained = funEnsembleCount(booleRetained, ppDominate.numbPoints);
+    return PoissonEnsemble(numbPointsRetained, xx[booleRetained], yy[booleRetained]);
+#end function
@@ -0,0 +1,148 @@
+# This code integrates a function fun_lambda (eg an intensity function) over
+# a rectangle, giving (for an intensity function) the total mean measure or
+# the average number of points, which is often found with
+# scipy.integrate.dblquad.
+#
+# Unlike dblquad, which calls fun_lambda for one point at a time, the
+# integral is found with tensor-product Gauss-Legendre rules, which
+# evaluate fun_lambda on arrays of points (for many cells at once). On each
+# cell (ie smaller rectangle), the integral is found with numbOrder and
+# 2*numbOrder points along each side, and the difference of the two is the
+# error estimate of the cell. Cells with error estimates that are too large
+# are divided into four equal cells, and this adaptive refinement is
+# repeated (up to numbLevelMax times) until the total error estimate is
+# small enough.
+#
+# Both rules can miss a narrow peak completely, giving a small (but wrong)
+# error estimate. So the refinement starts with a uniform grid of
+# numbGridInit x numbGridInit cells, and the cells are divided at least
+# numbLevelMin times. Also, the peaks of fun_lambda are found with
+# funLambdaPeaks (see funLambdaMax.py), with numbStart local searches, and a
+# cell with a peak is always divided while the peak is missed by the nodes of
+# the cell, meaning the largest value at the nodes is below the middle of
+# the minimum value at the nodes and the peak value. Once the peak is seen
+# by the nodes, the cell is treated like any other cell, so smooth
+# functions (whose peaks are seen by the first nodes) are not refined
+# further.
+#
+# This is a trade-off. Finding the peaks costs a few milliseconds (mainly
+# the local searches), so for a smooth function a call takes about 3-5 ms,
+# which can be slower than dblquad. But a narrow peak found by the local
+# searches is never missed (unlike dblquad). With one local search (the
+# default), this is only the largest peak; other narrow peaks (missed by
+# the grid of funLambdaPeaks) can still be missed.
+#
+# The result depends only on the function and the rectangle, so
+# getIntegralRectangle keeps the results in a least recently used (LRU)
+# cache, and repeated calls only calculate the integral once.
+#
+# EXAMPLE:
+# LambdaNumerical,errorNumerical=getIntegralRectangle(fun_lambda,[xMin,xMax,yMin,yMax]);
+#
+# INPUT:
+# fun_lambda is the function, which must accept arrays of x and y.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular integration window.
+# numbOrder is the number of Gauss-Legendre points along each side.
+# tolRel is the relative error tolerance.
+# tolAbs is the absolute error tolerance.
+# numbLevelMax is the maximum number of refinements.
+# numbGridInit is the number of initial cells along each side.
+# numbLevelMin is the minimum number of refinements.
+# numbStart is the number of local searches for peaks of fun_lambda.
+# OUTPUT:
+# integralValue is the (numerical) integral of fun_lambda over the rectangle.
+# errorValue is the error estimate of the integral.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from functools import lru_cache  # for caching results
+from funLambdaMax import funLambdaPeaks # type: ignore
+
+# tensor-product Gauss-Legendre rule with numbOrder points (along each side)
+# on many cells (ie rectangles), also returning the values at the nodes if
+# booleNodes is True
+def funGaussLegendreCells(fun_lambda, cellsRect, numbOrder, booleNodes=False):
+    tNodes, wNodes = np.polynomial.legendre.leggauss(numbOrder);
+    tNodes = (tNodes + 1) / 2;
+    wNodes = wNodes / 2;  # nodes and weights on [0,1]
+    xLow, xHigh, yLow, yHigh = (cellsRect[:, ii, None, None] for ii in range(4));
+    xx = xLow + (xHigh - xLow) * tNodes[None, :, None];
+    yy = yLow + (yHigh - yLow) * tNodes[None, None, :];
+    lambdaNodes = np.broadcast_to(fun_lambda(xx, yy), (cellsRect.shape[0], numbOrder, numbOrder));
+
+    areaCell = (cellsRect[:, 1] - cellsRect[:, 0]) * (cellsRect[:, 3] - cellsRect[:, 2]);
+    integralCell = areaCell * np.einsum('cij,i,j->c', lambdaNodes, wNodes, wNodes);
+    if booleNodes:
+        return integralCell, lambdaNodes;
+    #end if-statement
+    return integralCell;
+#end function
+
+def funIntegrateRectangle(fun_lambda, windowSim, numbOrder=8, tolRel=1e-10, tolAbs=0,
+                          numbLevelMax=10, numbGridInit=4, numbLevelMin=1, numbStart=1):
+    xMin, xMax, yMin, yMax = windowSim;
+    areaTotal = (xMax - xMin) * (yMax - yMin);
+    # initial uniform grid of cells
+    xxEdge = np.linspace(xMin, xMax, numbGridInit + 1);
+    yyEdge = np.linspace(yMin, yMax, numbGridInit + 1);
+    xLow, yLow = np.meshgrid(xxEdge[:-1], yyEdge[:-1], indexing='ij');
+    xHigh, yHigh = np.meshgrid(xxEdge[1:], yyEdge[1:], indexing='ij');
+    cellsRect = np.stack((xLow.ravel(), xHigh.ravel(), yLow.ravel(), yHigh.ravel()), axis=1);
+    # peaks of fun_lambda (which can be missed by both rules)
+    xyPeak, lambdaPeak = funLambdaPeaks(fun_lambda, windowSim, numbStart=numbStart);
+
+    integralValue = 0;
+    errorValue = 0;
+    for ll in range(numbLevelMax + 1):
+        # integral (and error estimate) of each cell with two rules
+        integralLow = funGaussLegendreCells(fun_lambda, cellsRect, numbOrder);
+        integralHigh, lambdaNodes = funGaussLegendreCells(fun_lambda, cellsRect, 2 * numbOrder, True);
+        errorCell = np.abs(integralHigh - integralLow);
+
+        # cells with a peak missed by the nodes (which are always divided)
+        xLow, xHigh, yLow, yHigh = (cellsRect[:, ii, None] for ii in range(4));
+        booleIn = ((xLow <= xyPeak[:, 0]) & (xyPeak[:, 0] <= xHigh) &
+                   (yLow <= xyPeak[:, 1]) & (xyPeak[:, 1] <= yHigh));
+        lambdaNodeMax = np.max(lambdaNodes, axis=(1, 2))[:, None];
+        lambdaNodeMin = np.min(lambdaNodes, axis=(1, 2))[:, None];
+        booleMissed = booleIn & (lambdaPeak - lambdaNodeMax > (lambdaPeak - lambdaNodeMin) / 2);
+        booleSplit = np.any(booleMissed, axis=1) | (ll < numbLevelMin);
+
+        # allowed error of each cell (in proportion to its area)
+        integralEstimate = integralValue + np.sum(integralHigh);
+        tolTotal = max(tolAbs, tolRel * abs(integralEstimate));
+        areaCell = (cellsRect[:, 1] - cellsRect[:, 0]) * (cellsRect[:, 3] - cellsRect[:, 2]);
+        booleDone = ((errorCell <= tolTotal * areaCell / areaTotal) & ~booleSplit) | (ll == numbLevelMax);
+        integralValue = integralValue + np.sum(integralHigh[booleDone]);
+        errorValue = errorValue + np.sum(errorCell[booleDone]);
+
+        # divide the remaining cells into four equal cells
+        cellsRect = cellsRect[~booleDone];
+        if (cellsRect.shape[0] == 0):
+            break;
+        #end if-statement
+        xLow, xHigh, yLow, yHigh = (cellsRect[:, ii] for ii in range(4));
+        xMid = (xLow + xHigh) / 2;
+        yMid = (yLow + yHigh) / 2;
+        cellsRect = np.concatenate((np.stack((xLow, xMid, yLow, yMid), axis=1),
+                                    np.stack((xMid, xHigh, yLow, yMid), axis=1),
+                                    np.stack((xLow, xMid, yMid, yHigh), axis=1),
+                                    np.stack((xMid, xHigh, yMid, yHigh), axis=1)));
+    #end for-loop
+
+    return float(integralValue), float(errorValue);
+#end function
+
+# cached results for the most recent functions and windows
+getIntegralCache = lru_cache(maxsize=128)(funIntegrateRectangle);
+
+# same as funIntegrateRectangle, but cached (windowSim is converted to a tuple)
+def getIntegralRectangle(fun_lambda, windowSim, numbOrder=8, tolRel=1e-10, tolAbs=0,
+                         numbLevelMax=10, numbGridInit=4, numbLevelMin=1, numbStart=1):
+    windowSim = tuple(float(valueTemp) for valueTemp in windowSim);
+    return getIntegralCache(fun_lambda, windowSim, numbOrder, tolRel, tolAbs, numbLevelMax,
+                            numbGridInit, numbLevelMin, numbStart);
+#end function
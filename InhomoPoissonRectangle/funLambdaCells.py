@@ -0,0 +1,96 @@
+# This code divides a rectangle into cells (ie smaller rectangles) and finds
+# an upper bound of an intensity function fun_lambda on each cell, giving a
+# piecewise-constant intensity that dominates fun_lambda. This can be used
+# for thinning instead of a single (global) maximum of fun_lambda (see
+# funInhomoPoissonThinning.py), so fewer points are thinned (ie discarded)
+# when the intensity function has peaks.
+#
+# The cells are found adaptively, like a quadtree. Starting with the whole
+# rectangle, the cell with the largest wasted mass (ie the upper bound
+# times the area minus the estimated integral of fun_lambda over the cell)
+# is divided into four equal cells, until there are (at least) numbCellMax
+# cells.
+#
+# A grid alone can miss narrow peaks, so the peaks of fun_lambda on the whole
+# rectangle are first found with funLambdaPeaks (see funLambdaMax.py). On
+# each cell, fun_lambda is evaluated on a grid of (numbSub+1)x(numbSub+1)
+# points (including the edges) and at the points of the cell nearest to each
+# peak (ie the peak itself, if it is in the cell). The largest of these
+# values is then refined with a local search in the cell (see
+# funLambdaRefine in funLambdaMax.py), and the upper bound is the largest
+# value found increased by the (relative) safety margin marginBound. A cell
+# with a peak then has a bound of at least the peak value, and the wasted
+# mass of such a cell is large, so it is divided until the peak is in a
+# small cell.
+#
+# INPUT:
+# fun_lambda is the intensity function, which must accept arrays of x and y.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular simulation window.
+# numbCellMax is the (minimum) number of cells.
+# numbSub is the number of grid intervals (along each side) in each cell.
+# marginBound is the relative safety margin added to the bounds.
+# OUTPUT:
+# cellsRect is an array with the rectangle [xMin,xMax,yMin,yMax] of each cell
+# on each row.
+# lambdaCell is an array of the upper bound of fun_lambda on each cell.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from funLambdaMax import funLambdaPeaks, funLambdaRefine # type: ignore
+
+# upper bounds and wasted masses of fun_lambda on many cells (ie rectangles),
+# where xyPeak are points (on the rows) with large values of fun_lambda
+def funLambdaCellBounds(fun_lambda, cellsRect, xyPeak, numbSub=8, marginBound=0.05):
+    numbCell = cellsRect.shape[0];
+    tGrid = np.linspace(0, 1, numbSub + 1);
+    # grid points in every cell (cells on the first axis)
+    xLow, xHigh, yLow, yHigh = (cellsRect[:, ii, None, None] for ii in range(4));
+    xx = xLow + (xHigh - xLow) * tGrid[None, :, None];
+    yy = yLow + (yHigh - yLow) * tGrid[None, None, :];
+    xx, yy = np.broadcast_arrays(xx, yy);
+    # points of every cell nearest to the peaks
+    xxPeak = np.clip(xyPeak[None, :, 0], xLow[:, :, 0], xHigh[:, :, 0]);
+    yyPeak = np.clip(xyPeak[None, :, 1], yLow[:, :, 0], yHigh[:, :, 0]);
+    xx = np.concatenate((xx.reshape(numbCell, -1), xxPeak), axis=1);
+    yy = np.concatenate((yy.reshape(numbCell, -1), yyPeak), axis=1);
+    lambdaPoints = np.broadcast_to(fun_lambda(xx, yy), xx.shape);
+
+    # refine the largest value of each cell with a local search (in the cell)
+    indexStart = np.argmax(lambdaPoints, axis=1);
+    lambdaMaxCell = lambdaPoints[np.arange(numbCell), indexStart];
+    for cc in range(numbCell):
+        xyStart = np.array([[xx[cc, indexStart[cc]], yy[cc, indexStart[cc]]]]);
+        _, lambdaRefine = funLambdaRefine(fun_lambda, cellsRect[cc], xyStart);
+        lambdaMaxCell[cc] = max(lambdaMaxCell[cc], lambdaRefine[0]);
+    #end for-loop
+
+    areaCell = (cellsRect[:, 1] - cellsRect[:, 0]) * (cellsRect[:, 3] - cellsRect[:, 2]);
+    lambdaCell = lambdaMaxCell * (1 + marginBound);
+    lambdaMean = np.mean(lambdaPoints[:, :(numbSub + 1) ** 2], axis=1); # grid average
+    massWasted = (lambdaCell - lambdaMean) * areaCell;
+    return lambdaCell, massWasted;
+#end function
+
+def funLambdaCells(fun_lambda, windowSim, numbCellMax=64, numbSub=8, marginBound=0.05):
+    xyPeak, _ = funLambdaPeaks(fun_lambda, windowSim);
+    cellsRect = np.array([windowSim], dtype=float);
+    lambdaCell, massWasted = funLambdaCellBounds(fun_lambda, cellsRect, xyPeak, numbSub, marginBound);
+    while (cellsRect.shape[0] < numbCellMax):
+        # divide the cell with the largest wasted mass into four cells
+        indexSplit = np.argmax(massWasted);
+        xLow, xHigh, yLow, yHigh = cellsRect[indexSplit];
+        xMid = (xLow + xHigh) / 2;
+        yMid = (yLow + yHigh) / 2;
+        cellsNew = np.array([[xLow, xMid, yLow, yMid], [xMid, xHigh, yLow, yMid],
+                             [xLow, xMid, yMid, yHigh], [xMid, xHigh, yMid, yHigh]]);
+        lambdaNew, massNew = funLambdaCellBounds(fun_lambda, cellsNew, xyPeak, numbSub, marginBound);
+
+        cellsRect = np.vstack((np.delete(cellsRect, indexSplit, axis=0), cellsNew));
+        lambdaCell = np.concatenate((np.delete(lambdaCell, indexSplit), lambdaNew));
+        massWasted = np.concatenate((np.delete(massWasted, indexSplit), massNew));
+    #end while-loop
+    return cellsRect, lambdaCell;
+#end function
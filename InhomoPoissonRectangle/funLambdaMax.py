@@ -0,0 +1,98 @@
+# This code finds an upper bound lambdaMax of an intensity function
+# fun_lambda on a rectangle, which is needed for thinning (see
+# InhomoPoissonRectangle.py and funInhomoPoissonThinning.py).
+#
+# A local search (eg scipy.optimize.minimize from the centre of the
+# rectangle) may only find a local maximum when the intensity function has
+# several peaks, which would underestimate lambdaMax and silently bias the
+# thinning. Instead, fun_lambda is first evaluated (in one step) on a grid of
+# numbGrid x numbGrid points, and then the numbStart largest grid values are
+# each refined with a local search (scipy.optimize.minimize). The largest
+# value found is increased by the (relative) safety margin marginBound.
+#
+# The grid scan and local searches are done by funLambdaPeaks, which returns
+# the points found (ie peaks) and their values, so they can be reused (eg by
+# funLambdaCells.py for the upper bounds on smaller cells). The local search
+# from given points on a rectangle is done by funLambdaRefine.
+#
+# The result depends only on the intensity function and the rectangle, so
+# getLambdaMax keeps the results in a least recently used (LRU) cache, and
+# repeated calls (eg in parameter sweeps) only calculate lambdaMax once.
+#
+# EXAMPLE:
+# lambdaMax=getLambdaMax(fun_lambda,[xMin,xMax,yMin,yMax]);
+#
+# INPUT:
+# fun_lambda is the intensity function, which must accept arrays of x and y.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular simulation window.
+# numbGrid is the number of grid points along each side.
+# numbStart is the number of grid points refined with a local search.
+# marginBound is the relative safety margin added to the maximum.
+# OUTPUT:
+# lambdaMax is an upper bound of fun_lambda on the rectangle.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from scipy.optimize import minimize  # for optimizing
+from functools import lru_cache  # for caching results
+
+# local search (scipy.optimize.minimize) for the maximum of fun_lambda on
+# the rectangle windowSim from each of the points xyStart (on the rows),
+# returning the points found and their values
+def funLambdaRefine(fun_lambda, windowSim, xyStart):
+    xMin, xMax, yMin, yMax = windowSim;
+
+    # negative of lambda
+    def fun_Neg(x):
+        return -fun_lambda(x[0], x[1]);
+
+    numbStart = xyStart.shape[0];
+    xyPeak = np.zeros((numbStart, 2));
+    lambdaPeak = np.zeros(numbStart);
+    for ss in range(numbStart):
+        resultsOpt = minimize(fun_Neg, xyStart[ss], bounds=((xMin, xMax), (yMin, yMax)));
+        xyPeak[ss] = resultsOpt.x;
+        lambdaPeak[ss] = -float(np.squeeze(resultsOpt.fun));
+    #end for-loop
+    return xyPeak, lambdaPeak;
+#end function
+
+# grid scan and local searches from the numbStart largest grid values,
+# returning the points found (ie peaks) and their values
+def funLambdaPeaks(fun_lambda, windowSim, numbGrid=64, numbStart=4):
+    xMin, xMax, yMin, yMax = windowSim;
+    # evaluate intensity function on a grid (including the edges)
+    xxGrid = np.linspace(xMin, xMax, numbGrid);
+    yyGrid = np.linspace(yMin, yMax, numbGrid);
+    X, Y = np.meshgrid(xxGrid, yyGrid, indexing='ij');
+    lambdaGrid = np.broadcast_to(fun_lambda(X, Y), X.shape).ravel();
+
+    # refine the largest grid values with a local search
+    numbStart = min(numbStart, lambdaGrid.size);
+    indexStart = np.argpartition(lambdaGrid, -numbStart)[-numbStart:];
+    xyStart = np.stack((X.ravel()[indexStart], Y.ravel()[indexStart]), axis=1);
+    xyPeak, lambdaPeak = funLambdaRefine(fun_lambda, windowSim, xyStart);
+
+    # keep the grid point if the local search did not improve on it
+    booleGrid = (lambdaPeak < lambdaGrid[indexStart]);
+    xyPeak[booleGrid] = xyStart[booleGrid];
+    lambdaPeak[booleGrid] = lambdaGrid[indexStart][booleGrid];
+    return xyPeak, lambdaPeak;
+#end function
+
+def funLambdaMax(fun_lambda, windowSim, numbGrid=64, numbStart=4, marginBound=0.01):
+    _, lambdaPeak = funLambdaPeaks(fun_lambda, windowSim, numbGrid, numbStart);
+    return np.max(lambdaPeak) * (1 + marginBound);
+#end function
+
+# cached results for the most recent intensity functions and windows
+getLambdaMaxCache = lru_cache(maxsize=128)(funLambdaMax);
+
+# same as funLambdaMax, but cached (windowSim is converted to a tuple)
+def getLambdaMax(fun_lambda, windowSim, numbGrid=64, numbStart=4, marginBound=0.01):
+    windowSim = tuple(float(valueTemp) for valueTemp in windowSim);
+    return getLambdaMaxCache(fun_lambda, windowSim, numbGrid, numbStart, marginBound);
+#end function
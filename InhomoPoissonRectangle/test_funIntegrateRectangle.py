@@ -0,0 +1,44 @@
+# Tests for funIntegrateRectangle.py (run with pytest).
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import os, sys  # for finding the code in this folder
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)));
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import pytest
+from scipy.integrate import dblquad  # for the reference integrals
+from funIntegrateRectangle import funIntegrateRectangle # type: ignore
+
+# off-centre narrow peaks (on a constant background), which are missed by
+# both Gauss-Legendre rules on the whole window
+@pytest.mark.parametrize('lambdaBase,heightPeak,widthPeak', [(10, 50, 0.01), (1, 200, 0.003)])
+def test_integral_narrow_peak(lambdaBase, heightPeak, widthPeak):
+    xPeak, yPeak = 0.83, -0.71;
+
+    def fun_lambda(x, y):
+        return lambdaBase + heightPeak * np.exp(-((x - xPeak) ** 2 + (y - yPeak) ** 2) / widthPeak ** 2);
+
+    windowSim = [-1, 1, -1, 1];
+    integralValue, _ = funIntegrateRectangle(fun_lambda, windowSim);
+
+    # dblquad on the four rectangles meeting at the peak (so it is not missed)
+    integralRef = 0;
+    for xLow, xHigh in [(-1, xPeak), (xPeak, 1)]:
+        for yLow, yHigh in [(-1, yPeak), (yPeak, 1)]:
+            integralRef += dblquad(lambda y, x: fun_lambda(x, y), xLow, xHigh, yLow, yHigh,
+                                   epsabs=1e-12, epsrel=1e-12)[0];
+        #end for-loop
+    #end for-loop
+    assert integralValue == pytest.approx(integralRef, rel=1e-9);
+    assert integralValue > 4 * lambdaBase + 0.9 * np.pi * heightPeak * widthPeak ** 2;
+
+def test_integral_smooth():
+    def fun_lambda(x, y):
+        return 100 * np.exp(-(x ** 2 + y ** 2) / 0.5 ** 2);
+
+    integralValue, errorValue = funIntegrateRectangle(fun_lambda, [-1, 1, -1, 1]);
+    integralRef = dblquad(lambda y, x: fun_lambda(x, y), -1, 1, -1, 1, epsabs=1e-12, epsrel=1e-12)[0];
+    assert integralValue == pytest.approx(integralRef, rel=1e-10);
+    assert errorValue < 1e-8;
@@ -0,0 +1,32 @@
+# Tests for funLambdaCells.py (run with pytest).
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import os, sys  # for finding the code in this folder
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)));
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import pytest
+from funLambdaCells import funLambdaCells # type: ignore
+from funInhomoPoissonThinning import funInhomoPoissonThinning # type: ignore
+
+# narrow peaks (of height heightPeak and width widthPeak) missed by the grids
+@pytest.mark.parametrize('heightPeak,widthPeak', [(200, 0.003), (10**5, 0.004)])
+@pytest.mark.parametrize('xyPeak', [(0, 0), (0.83, -0.71)])
+def test_cells_bound_narrow_peak(heightPeak, widthPeak, xyPeak):
+    def fun_lambda(x, y):
+        return 1 + heightPeak * np.exp(-((x - xyPeak[0]) ** 2 + (y - xyPeak[1]) ** 2) / widthPeak ** 2);
+
+    windowSim = [-1, 1, -1, 1];
+    cellsRect, lambdaCell = funLambdaCells(fun_lambda, windowSim, 64);
+    booleIn = ((cellsRect[:, 0] <= xyPeak[0]) & (xyPeak[0] <= cellsRect[:, 1]) &
+               (cellsRect[:, 2] <= xyPeak[1]) & (xyPeak[1] <= cellsRect[:, 3]));
+    assert np.all(lambdaCell[booleIn] >= 1 + heightPeak);
+
+    # thinning does not raise and gives the right average number of points
+    numbSim = 10**5;
+    ppEnsemble = funInhomoPoissonThinning(numbSim, fun_lambda, None, windowSim, seedRand=1,
+                                          numbCellMax=64);
+    LambdaExact = 4 + np.pi * heightPeak * widthPeak ** 2;  # peak is well inside window
+    assert abs(np.mean(ppEnsemble.numbPoints) - LambdaExact) < 4 * np.sqrt(LambdaExact / numbSim);
@@ -11,7 +11,9 @@ import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # for plotting
 from matplotlib import cm  # for heatmap plotting
 from mpl_toolkits import mplot3d  # for 3-D plots
-from scipy import integrate  # for integrating
+import sys, os  # for finding the code in the InhomoPoissonRectangle folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'InhomoPoissonRectangle'));
+from funIntegrateRectangle import getIntegralRectangle # type: ignore
 
 plt.close("all");  # close all previous plots
 
@@ -33,7 +35,7 @@ def fun_lambda(x, y):
     return np.exp(-(x ** 4 + x*y + y ** 2) / s ** 2);
 
 # normalization constant
-consNorm = integrate.dblquad(fun_lambda, xMin, xMax, lambda x: yMin, lambda y: yMax)[0];
+consNorm, _ = getIntegralRectangle(fun_lambda, [xMin, xMax, yMin, yMax]);
 #un-normalized joint density of variables to be simulated
 def fun_p(x, y):
     return (fun_lambda(x, y) ) * (x >= xMin) * (y >= yMin) * (x <= xMax) * (y <= yMax);
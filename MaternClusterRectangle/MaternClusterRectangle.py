@@ -7,6 +7,9 @@
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # For plotting
+import sys, os  # for finding the code in the PoissonFast folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonFast'));
+from funMortonSort import funMortonSort # type: ignore
 
 plt.close('all');  # close all figures
 
@@ -21,6 +24,11 @@ lambdaParent = 10;  # density of parent Poisson point process
 lambdaDaughter = 100;  # mean number of points in each cluster
 radiusCluster = 0.1;  # radius of cluster disk (for daughter points)
 
+# data type of coordinates -- np.float32 (single precision) halves the memory
+dtypeCoord = np.float64;
+rng = np.random.default_rng();  # random number generator (supports dtype)
+booleSortMorton = False;  # set to True to sort points along a Z-order curve
+
 # Extended simulation windows parameters
 rExt = radiusCluster;  # extension parameter -- use cluster radius
 xMinExt = xMin - rExt;
@@ -33,19 +41,19 @@ yDeltaExt = yMaxExt - yMinExt;
 areaTotalExt = xDeltaExt * yDeltaExt;  # area of extended rectangle
 
 # Simulate Poisson point process for the parents
-numbPointsParent = np.random.poisson(areaTotalExt * lambdaParent);  # Poisson number of points
+numbPointsParent = rng.poisson(areaTotalExt * lambdaParent);  # Poisson number of points
 # x and y coordinates of Poisson points for the parent
-xxParent = xMinExt + xDeltaExt * np.random.uniform(0, 1, numbPointsParent);
-yyParent = yMinExt + yDeltaExt * np.random.uniform(0, 1, numbPointsParent);
+xxParent = xMinExt + xDeltaExt * rng.random(numbPointsParent, dtype=dtypeCoord);
+yyParent = yMinExt + yDeltaExt * rng.random(numbPointsParent, dtype=dtypeCoord);
 
 # Simulate Poisson point process for the daughters (ie final poiint process)
-numbPointsDaughter = np.random.poisson(lambdaDaughter, numbPointsParent);
+numbPointsDaughter = rng.poisson(lambdaDaughter, numbPointsParent);
 numbPoints = sum(numbPointsDaughter);  # total number of points
 
 # Generate the (relative) locations in polar coordinates by
 # simulating independent variables.
-theta = 2 * np.pi * np.random.uniform(0, 1, numbPoints);  # angular coordinates
-rho = radiusCluster * np.sqrt(np.random.uniform(0, 1, numbPoints));  # radial coordinates
+theta = 2 * np.pi * rng.random(numbPoints, dtype=dtypeCoord);  # angular coordinates
+rho = radiusCluster * np.sqrt(rng.random(numbPoints, dtype=dtypeCoord));  # radial coordinates
 
 # Convert from polar to Cartesian coordinates
 xx0 = rho * np.cos(theta);
@@ -65,6 +73,10 @@ booleInside = ((xx >= xMin) & (xx <= xMax) & (yy >= yMin) & (yy <= yMax));
 xx = xx[booleInside];  
 yy = yy[booleInside];
 
+if booleSortMorton:
+    # sort points so nearby points are nearby in memory (eg for k-d trees)
+    xx, yy = funMortonSort(xx, yy, [xMin, xMax, yMin, yMax]);
+
 # Plotting
 plt.scatter(xx, yy, edgecolor='b', facecolor='none', alpha=0.5);
 plt.xlabel('x');
@@ -75,7 +75,7 @@ def funBoundaries(dimLin):
     return matNeigh
 #end function
 
-def funRandPermute(numbSite):
+def funRandPermute(numbSite, pool=None):
     # This function generates a random permutation. It performs the
     # Durstenfield version of Fisher-Yates shuffle.  See Algorithm P
     # in "Art of Scientific Programming -- Volume 1" by Knuth.
@@ -83,12 +83,17 @@ def funRandPermute(numbSite):
     # https://en.wikipedia.org/wiki/Fisher%E2%80%93Yates_shuffle
     #
     # Recommended to use the built-in numpy function numpy.random.permutation
+    #
+    # pool is a RandomPool (see the folder PoissonLargeMean) for the random
+    # integers, which is faster than calling numpy.random.randint each time
+    # (None to use numpy.random.randint).
 
     #initialize order array
     indexOrder = np.arange(numbSite)
     
     for i in range(numbSite):
-        j = np.random.randint(i, numbSite)  # random integer j st i<=j<numbSite       
+        # random integer j st i<=j<numbSite
+        j = np.random.randint(i, numbSite) if pool is None else pool.integers(i, numbSite)
         
         #swap numbers at i and j
         indexTemp = indexOrder[i]
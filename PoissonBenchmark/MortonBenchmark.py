@@ -0,0 +1,74 @@
+# This code compares (by timing) neighbour calculations on realizations of
+# a Poisson point process on the unit square with the points in random
+# order (as simulated) and sorted along a Z-order (or Morton) curve with
+# PoissonFast/funMortonSort.py.
+#
+# The calculations are building a k-d tree (with SciPy), querying the
+# nearest neighbour of every point and binning the points on a fine grid.
+# The point patterns are simulated (and sorted) before timing, so only the
+# calculations are timed. The results are written to a JSON file in the
+# same format as PoissonBenchmark.py.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from scipy.spatial import cKDTree  # for k-d trees
+from PoissonBenchmark import funBenchmarkAll, funWriteResults # type: ignore
+from funMortonSort import funMortonSort # type: ignore
+
+###START Parameters START###
+numbSimValues = [1];  # one realization for each intensity
+lambdaValues = [10 ** 5, 10 ** 6];  # intensities (ie mean number of points)
+numbRepeat = 5;  # number of timings for each method and parameter pair
+numbGrid = 1024;  # number of grid cells along each side for binning
+fileResults = 'MortonBenchmark.json';  # file for results
+windowSim = [0, 1, 0, 1];  # unit square
+###END Parameters END###
+
+### START - Function definitions ###
+dictPattern = {};  # simulated patterns (so simulation is not timed)
+
+# return a realization (random or sorted order) with intensity lambda0
+def funPattern(lambda0, booleMorton):
+    if (lambda0, booleMorton) not in dictPattern:
+        rng = np.random.default_rng(1);
+        numbPoints = rng.poisson(lambda0);  # Poisson number of points
+        xx = rng.random(numbPoints);  # x coordinates of Poisson points
+        yy = rng.random(numbPoints);  # y coordinates of Poisson points
+        if booleMorton:
+            xx, yy = funMortonSort(xx, yy, windowSim);
+        #end if-statement
+        dictPattern[(lambda0, booleMorton)] = np.column_stack((xx, yy));
+    #end if-statement
+    return dictPattern[(lambda0, booleMorton)];
+#end function
+
+def funBuildTree(lambda0, booleMorton):
+    return cKDTree(funPattern(lambda0, booleMorton));
+
+def funQueryTree(lambda0, booleMorton):
+    xxyy = funPattern(lambda0, booleMorton);
+    treePoints = cKDTree(xxyy);
+    return treePoints.query(xxyy, k=2);  # nearest neighbour (other than itself)
+
+def funBinGrid(lambda0, booleMorton):
+    xxyy = funPattern(lambda0, booleMorton);
+    indexCell = (xxyy[:, 0] * numbGrid).astype(np.int64) * numbGrid + (xxyy[:, 1] * numbGrid).astype(np.int64);
+    return np.bincount(indexCell, minlength=numbGrid ** 2);
+
+# methods to be compared (with signature funSim(numbSim,lambda0))
+dictMethod = {};
+for nameCalc, funCalc in [('KDTreeBuild', funBuildTree), ('KDTreeQuery', funQueryTree),
+                          ('GridBinning', funBinGrid)]:
+    dictMethod[nameCalc + '_Random'] = (lambda numbSim, lambda0, funCalc=funCalc: funCalc(lambda0, False), False);
+    dictMethod[nameCalc + '_Morton'] = (lambda numbSim, lambda0, funCalc=funCalc: funCalc(lambda0, True), False);
+#end for-loop
+### END - Function definitions ###
+
+if __name__ == '__main__':
+    listResults = funBenchmarkAll(dictMethod, numbSimValues, lambdaValues, numbRepeat, 0);
+    funWriteResults(fileResults, listResults);
+    print('Results written to', fileResults);
+#end if-statement
@@ -0,0 +1,183 @@
+# This code compares (by timing) different methods for simulating Poisson
+# point processes and Poisson variables over a grid of parameters, namely
+# the number of simulations numbSim and the intensity (or mean) lambda0.
+#
+# The methods are based on the code in the folders:
+# PoissonFast -- Method A (vectorized) and Method B (for-loop);
+# PoissonRectangle -- one realization per iteration of a for-loop;
+# InhomoPoissonRectangle -- thinning one realization per iteration;
+# PoissonLargeMean -- Algorithms PTRS and PA, one variate per function call.
+#
+# Method A is also run with single-precision (np.float32) coordinates, which
+# use half the memory of double-precision (np.float64) coordinates.
+#
+# Each method is run numbRepeat times for each pair of parameters, giving
+# the median and interquartile range (IQR) of the times, the throughput
+# (simulations per second) and the peak memory (found with tracemalloc in
+# an extra run). The results are written to a JSON file, so different runs
+# (or versions of the code) can be compared.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import time  # for timing
+import tracemalloc  # for measuring peak memory
+import json  # for writing results
+import platform  # for recording the computer used
+import sys, os  # for finding the code in other folders
+pathRepo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..');
+sys.path.append(os.path.join(pathRepo, 'PoissonFast'));
+sys.path.append(os.path.join(pathRepo, 'PoissonLargeMean'));
+from funPoissonFastA import funPoissonFastA # type: ignore
+from funPoissonLargePTRS import funPoissonLargePTRS # type: ignore
+from funPoissonLargePA import funPoissonLargePA # type: ignore
+
+###START Parameters START###
+numbSimValues = [10 ** 3, 10 ** 4, 10 ** 5];  # numbers of simulations
+lambdaValues = [10, 50, 100];  # intensities (or Poisson means)
+numbRepeat = 5;  # number of timings for each method and parameter pair
+numbLoopMax = 10 ** 5;  # skip for-loop methods with more iterations than this
+fileResults = 'PoissonBenchmark.json';  # file for results
+
+# Simulation window parameters
+xMin = 0;
+xMax = 1;
+yMin = 0;
+yMax = 1;
+windowSim = [xMin, xMax, yMin, yMax];
+xDelta = xMax - xMin;
+yDelta = yMax - yMin;  # rectangle dimensions
+areaTotal = xDelta * yDelta;  # area of rectangle
+###END Parameters END###
+
+### START - Function definitions ###
+# Method A in PoissonFast.py: generate *all* ensembles at once
+def funSimFastA(numbSim, lambda0):
+    numbPoints = np.random.poisson(areaTotal * lambda0, numbSim);  # Poisson number of points
+    numbPointsTotal = np.sum(numbPoints);
+    xxAll = xDelta * (np.random.rand(numbPointsTotal)) + xMin;  # x coordinates of Poisson points
+    yyAll = yDelta * (np.random.rand(numbPointsTotal)) + yMin;  # y coordinates of Poisson points
+    return numbPoints, xxAll, yyAll;
+
+# Method A with seeded streams (PoissonFast/funPoissonFastA.py)
+def funSimFastStreams(numbSim, lambda0):
+    return funPoissonFastA(numbSim, lambda0, windowSim, 1);
+
+# Method A with single-precision coordinates
+def funSimFastStreams32(numbSim, lambda0):
+    return funPoissonFastA(numbSim, lambda0, windowSim, 1, np.float32);
+
+# Method B in PoissonFast.py: generate each ensemble separately
+def funSimFastB(numbSim, lambda0):
+    xxList = [];
+    yyList = [];
+    for ss in range(numbSim):
+        numbPointsTemp = np.random.poisson(areaTotal * lambda0);  # Poisson number of points
+        xxList.append(xDelta * (np.random.rand(numbPointsTemp)) + xMin);
+        yyList.append(yDelta * (np.random.rand(numbPointsTemp)) + yMin);
+    return xxList, yyList;
+
+# PoissonRectangle.py run numbSim times
+def funSimRectangle(numbSim, lambda0):
+    for ss in range(numbSim):
+        numbPoints = np.random.poisson(lambda0 * areaTotal);  # Poisson number of points
+        xx = xDelta * np.random.uniform(0, 1, numbPoints) + xMin;  # x coordinates of Poisson points
+        yy = yDelta * np.random.uniform(0, 1, numbPoints) + yMin;  # y coordinates of Poisson points
+    return xx, yy;
+
+# InhomoPoissonRectangle.py (thinning) with maximum intensity lambda0
+def funSimInhomo(numbSim, lambda0):
+    s = 0.5;  # scale parameter
+    fun_p = lambda x, y: np.exp(-(x ** 2 + y ** 2) / s ** 2);  # thinning probability
+    numbPointsRetained = np.zeros(numbSim);
+    for ii in range(numbSim):
+        numbPoints = np.random.poisson(areaTotal * lambda0);  # Poisson number of points
+        xx = np.random.uniform(0, xDelta, numbPoints) + xMin;  # x coordinates of Poisson points
+        yy = np.random.uniform(0, yDelta, numbPoints) + yMin;  # y coordinates of Poisson points
+        booleRetained = np.random.uniform(0, 1, numbPoints) < fun_p(xx, yy);
+        numbPointsRetained[ii] = np.sum(booleRetained);
+    return numbPointsRetained;
+
+# Poisson variables with mean lambda0 from PoissonLargeMean
+def funSimPTRS(numbSim, lambda0):
+    return np.array([funPoissonLargePTRS(lambda0) for ss in range(numbSim)]);
+
+def funSimPA(numbSim, lambda0):
+    return np.array([funPoissonLargePA(lambda0) for ss in range(numbSim)]);
+
+# methods to be compared, with a boolean for methods using a for-loop
+dictMethod = {
+    'PoissonFast_MethodA': (funSimFastA, False),
+    'PoissonFast_MethodA_Streams': (funSimFastStreams, False),
+    'PoissonFast_MethodA_Streams_Float32': (funSimFastStreams32, False),
+    'PoissonFast_MethodB': (funSimFastB, True),
+    'PoissonRectangle_Loop': (funSimRectangle, True),
+    'InhomoPoissonRectangle_Loop': (funSimInhomo, True),
+    'PoissonLargeMean_PTRS': (funSimPTRS, True),
+    'PoissonLargeMean_PA': (funSimPA, True),
+};
+
+# time a method numbRepeat times and find its peak memory
+def funBenchmark(funSim, numbSim, lambda0, numbRepeat):
+    funSim(numbSim, lambda0);  # warm-up run (not timed)
+    timeAll = np.zeros(numbRepeat);
+    for rr in range(numbRepeat):
+        t0 = time.perf_counter();  # start timing
+        funSim(numbSim, lambda0);
+        timeAll[rr] = time.perf_counter() - t0;  # finish timing
+    #end for-loop
+
+    # peak memory (NumPy arrays are traced by tracemalloc)
+    tracemalloc.start();
+    funSim(numbSim, lambda0);
+    _, memoryPeak = tracemalloc.get_traced_memory();
+    tracemalloc.stop();
+
+    timeMedian = np.median(timeAll);
+    timeIQR = np.percentile(timeAll, 75) - np.percentile(timeAll, 25);
+    dictResult = {'numbSim': numbSim, 'lambda0': lambda0, 'numbRepeat': numbRepeat,
+                  'timeMedian': timeMedian, 'timeIQR': timeIQR,
+                  'throughput': numbSim / timeMedian, 'memoryPeak': memoryPeak,
+                  'timeAll': timeAll.tolist()};
+    return dictResult;
+#end function
+
+# run all methods over the parameter grid
+def funBenchmarkAll(dictMethod, numbSimValues, lambdaValues, numbRepeat, numbLoopMax):
+    listResults = [];
+    for nameMethod, (funSim, booleLoop) in dictMethod.items():
+        for numbSim in numbSimValues:
+            if booleLoop and (numbSim > numbLoopMax):
+                continue;  # too slow
+            #end if-statement
+            for lambda0 in lambdaValues:
+                dictResult = funBenchmark(funSim, numbSim, lambda0, numbRepeat);
+                dictResult['method'] = nameMethod;
+                listResults.append(dictResult);
+                print(nameMethod, 'numbSim =', numbSim, 'lambda0 =', lambda0,
+                      'median time =', dictResult['timeMedian'], 'seconds.');
+            #end for-loop
+        #end for-loop
+    #end for-loop
+    return listResults;
+#end function
+
+# write results and details of the computer/software to a JSON file
+def funWriteResults(fileResults, listResults):
+    dictInfo = {'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(), 'numpy': np.__version__,
+                'platform': platform.platform(), 'processor': platform.processor()};
+    with open(fileResults, 'w') as fileTemp:
+        json.dump({'info': dictInfo, 'results': listResults}, fileTemp, indent=2,
+                  default=lambda x: x.item());
+    #end with-statement
+#end function
+### END - Function definitions ###
+
+if __name__ == '__main__':
+    listResults = funBenchmarkAll(dictMethod, numbSimValues, lambdaValues, numbRepeat, numbLoopMax);
+    funWriteResults(fileResults, listResults);
+    print('Results written to', fileResults);
+#end if-statement
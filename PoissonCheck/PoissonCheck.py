@@ -15,9 +15,14 @@ import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # for plotting
 from matplotlib import cm  # for heatmap plotting
 from mpl_toolkits import mplot3d  # for 3-D plots
-from scipy.optimize import minimize  # for optimizing
-from scipy import integrate  # for integrating
 from scipy.stats import poisson  # for the Poisson probability mass function
+import sys, os  # for finding the code in the PoissonLargeMean and InhomoPoissonRectangle folders
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonLargeMean'));
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'InhomoPoissonRectangle'));
+from funPoissonEmpPMF import funPoissonEmpPMF # type: ignore
+from funInhomoPoissonThinning import funInhomoPoissonThinning # type: ignore
+from funLambdaMax import getLambdaMax # type: ignore
+from funIntegrateRectangle import getIntegralRectangle # type: ignore
 
 plt.close('all');  # close all plots
 
@@ -32,6 +37,8 @@ areaTotal = xDelta * yDelta;
 
 numbSim = 10 ** 4;  # number of simulations
 numbBins = 30;  # number of bins for histogram
+booleBatch = True;  # simulate (and thin) all simulations at once instead of a for-loop
+numbCellMax = 64;  # cells with local upper bounds of lambda for thinning (None for lambdaMax only)
 
 # Point process parameters
 s = 0.5;  # scale parameter
@@ -46,19 +53,10 @@ def fun_lambda(x, y):
 
 ###START -- find maximum lambda -- START ###
 # For an intensity function lambda, given by function fun_lambda,
-# finds the maximum of lambda in a rectangular region given by
-# [xMin,xMax,yMin,yMax].
-def fun_Neg(x):
-    return -fun_lambda(x[0], x[1]);  # negative of lambda
-
-
-xy0 = [(xMin + xMax) / 2, (yMin + yMax) / 2];  # initial value(ie centre)
-# Find largest lambda value
-resultsOpt = minimize(fun_Neg, xy0, bounds=((xMin, xMax), (yMin, yMax)));
-lambdaNegMin = resultsOpt.fun;  # retrieve minimum value found by minimize
-lambdaMax = -lambdaNegMin;
-
-
+# finds (an upper bound of) the maximum of lambda in a rectangular region
+# given by [xMin,xMax,yMin,yMax], using a grid of values refined with
+# local searches (see funLambdaMax.py).
+lambdaMax = getLambdaMax(fun_lambda, [xMin, xMax, yMin, yMax]);
 ###END -- find maximum lambda -- END ###
 
 # define thinning probability function
@@ -66,30 +64,38 @@ def fun_p(x, y):
     return fun_lambda(x, y) / lambdaMax;
 
 
-# for collecting statistics -- set numbSim=1 for one simulation
-numbPointsRetained = np.zeros(numbSim);  # vector to record number of points
-xxAll = [];
-yyAll = [];
-
 ### START -- Simulation section -- START ###
-for ii in range(numbSim):
-    # Simulate a Poisson point process
-    numbPoints = np.random.poisson(lambdaMax * areaTotal);  # Poisson number of points
-    xx = xDelta * np.random.uniform(0, 1, numbPoints) + xMin;  # x coordinates of Poisson points
-    yy = yDelta * np.random.uniform(0, 1, numbPoints) + yMin;  # y coordinates of Poisson points
-
-    # calculate spatially-dependent thinning probabilities
-    p = fun_p(xx, yy);
-
-    # Generate Bernoulli variables (ie coin flips) for thinning
-    booleRetained = np.random.uniform(0, 1, numbPoints) < p;  # points to be thinned
-
-    # x/y locations of retained points
-    xxRetained = xx[booleRetained];
-    yyRetained = yy[booleRetained];
-    numbPointsRetained[ii] = xxRetained.size;
-    xxAll.extend(xxRetained);
-    yyAll.extend(yyRetained);
+if booleBatch:
+    # all simulations at once (retained points in a PoissonEnsemble)
+    windowSim = [xMin, xMax, yMin, yMax];
+    ppEnsemble = funInhomoPoissonThinning(numbSim, fun_lambda, lambdaMax, windowSim, numbCellMax=numbCellMax);
+    numbPointsRetained = ppEnsemble.numbPoints;  # vector of number of points
+    xxAll = ppEnsemble.xx;
+    yyAll = ppEnsemble.yy;
+    xxRetained, yyRetained = ppEnsemble[-1];  # last simulation (for plotting)
+else:
+    # for collecting statistics -- set numbSim=1 for one simulation
+    numbPointsRetained = np.zeros(numbSim);  # vector to record number of points
+    xxAll = [];
+    yyAll = [];
+    for ii in range(numbSim):
+        # Simulate a Poisson point process
+        numbPoints = np.random.poisson(lambdaMax * areaTotal);  # Poisson number of points
+        xx = xDelta * np.random.uniform(0, 1, numbPoints) + xMin;  # x coordinates of Poisson points
+        yy = yDelta * np.random.uniform(0, 1, numbPoints) + yMin;  # y coordinates of Poisson points
+
+        # calculate spatially-dependent thinning probabilities
+        p = fun_p(xx, yy);
+
+        # Generate Bernoulli variables (ie coin flips) for thinning
+        booleRetained = np.random.uniform(0, 1, numbPoints) < p;  # points to be thinned
+
+        # x/y locations of retained points
+        xxRetained = xx[booleRetained];
+        yyRetained = yy[booleRetained];
+        numbPointsRetained[ii] = xxRetained.size;
+        xxAll.extend(xxRetained);
+        yyAll.extend(yyRetained);
 ### END -- Simulation section -- END ###
 
 # Plotting a simulation
@@ -103,15 +109,10 @@ plt.show();
 # run empirical test on number of points generated
 ###START -- Checking number of points -- START###
 # total mean measure (average number of points)
-LambdaNumerical = integrate.dblquad(fun_lambda, xMin, xMax, lambda x: yMin, lambda y: yMax)[0];
-# Test: as numbSim increases, numbPointsMean converges to LambdaNumerical
-numbPointsMean = np.mean(numbPointsRetained);
-# Test: as numbSim increases, numbPointsVar converges to LambdaNumerical
-numbPointsVar = np.var(numbPointsRetained);
-binEdges = np.arange(numbPointsRetained.min(), (numbPointsRetained.max() + 1)) - 0.5;
-pdfEmp, binEdges = np.histogram(numbPointsRetained, bins=binEdges, density=True);
-
-nValues = np.arange(numbPointsRetained.min(), numbPointsRetained.max());
+LambdaNumerical, _ = getIntegralRectangle(fun_lambda, [xMin, xMax, yMin, yMax]);
+# empirical distribution (using a bincount), mean and variance of number of points
+# Test: as numbSim increases, numbPointsMean and numbPointsVar converge to LambdaNumerical
+nValues, pdfEmp, numbPointsMean, numbPointsVar, _ = funPoissonEmpPMF(numbPointsRetained);
 # analytic solution of probability density
 pdfExact = (poisson.pmf(nValues, LambdaNumerical));
 
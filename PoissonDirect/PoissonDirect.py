@@ -13,6 +13,12 @@
 # function numpy.random.poisson, which is much faster. Use it -- not this function.
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
+import sys, os  # for finding the code in the PoissonLargeMean folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonLargeMean'));
+from funStatsRejection import funStatsRejection, funStatsSummary # type: ignore
+from funPoissonDirectBatch import funPoissonDirectBatch # type: ignore
+from funPoissonInverseBatch import funPoissonInverseBatch # type: ignore
+from RandomPool import RandomPool # type: ignore
 
 mu=5; #Poisson parameter
 numbSim=10**2; #number of simulations
@@ -22,21 +28,31 @@ muVector=mu*np.ones(numbSim);
 ### START - Function definitions ###
 
 #Use while loop to generate Poisson variates
-def funPoissonLoop(mu):
+#statsRNG is a dictionary of counters from funStatsRejection (None for no counting)
+#pool is a RandomPool for the random variables (None to use np.random)
+def funPoissonLoop(mu, statsRNG=None, pool=None):
     T=0; #initialize sum of exponential variables as zero
     n=-1;#initialize counting variable as negative one
     
     while (T<1):
-        E=-(1/mu)*np.log(np.random.rand(1));#generate exponential random variable
+        #generate exponential random variable
+        E=-(1/mu)*np.log(np.random.rand(1)) if pool is None else pool.exponential()/mu;
         T=T+E; #update sum of exponential variables
         n=n+1; #update number of exponential variables
     
+    if statsRNG is not None:
+        statsRNG['numbIteration']+=n+1;
+        statsRNG['numbUniform']+=n+1;
+        statsRNG['numbCandidate']+=1;
+        statsRNG['numbSample']+=1;
+    
     N=n;
     return N;
 
 #Use recursion to generate Poisson variates
 #WARNING: Might be slow or use up too much memory
-def funPoissonRecursive(mu):
+#pool is a RandomPool for the random variables (None to use np.random)
+def funPoissonRecursive(mu, pool=None):
     T=0; #initialize sum of exponential variables as zero
     n=-1; #initialize counting variable as negative one    
     
@@ -45,7 +61,7 @@ def funPoissonRecursive(mu):
             #run if sum of exponential variables is not high enough
             
             #generate exponential random variable
-            E=(-np.log(np.random.rand(1)))/nu;
+            E=(-np.log(np.random.rand(1)))/nu if pool is None else pool.exponential()/nu;
             S=S+E; #update sum of exponential variables
             m=m+1; #update nunber of exponential variables
             
@@ -63,17 +79,38 @@ def funPoissonRecursive(mu):
 ### END - Function definitions ###
 
 #generate many Poisson variables
-randPoissonLoop=np.array(list(map(lambda x: funPoissonLoop(x), muVector)));
+randPoissonBatch=funPoissonDirectBatch(muVector); #all at once (no loop or recursion)
+randPoissonInverse=funPoissonInverseBatch(muVector); #inverse method (cached tables)
+statsLoop=funStatsRejection(); #counters for the while loop method
+randPoissonLoop=np.array(list(map(lambda x: funPoissonLoop(x,statsLoop), muVector)));
 randPoissonRecursive=np.array(list(map(lambda x: funPoissonRecursive(x), muVector)));
+poolRand=RandomPool(); #pool of random numbers (faster for scalar functions)
+randPoissonPool=np.array(list(map(lambda x: funPoissonLoop(x,pool=poolRand), muVector)));
 
 #calculate sample mean
+meanPoissonBatch=np.mean(randPoissonBatch)
+print('meanPoissonBatch = ',meanPoissonBatch)
+meanPoissonInverse=np.mean(randPoissonInverse)
+print('meanPoissonInverse = ',meanPoissonInverse)
 meanPoissonLoop=np.mean(randPoissonLoop)
 print('meanPoissonLoop = ',meanPoissonLoop)
 meanPoissonRecursive=np.mean(randPoissonRecursive)
 print('meanPoissonRecursive = ',meanPoissonRecursive)
+meanPoissonPool=np.mean(randPoissonPool)
+print('meanPoissonPool = ',meanPoissonPool)
 
 #calculate sample variance
+varPoissonBatch=np.var(randPoissonBatch)
+print('varPoissonBatch = ',varPoissonBatch)
+varPoissonInverse=np.var(randPoissonInverse)
+print('varPoissonInverse = ',varPoissonInverse)
 varPoissonLoop=np.var(randPoissonLoop)
 print('varPoissonLoop = ',varPoissonLoop)
 varPoissonRecursive=np.var(randPoissonRecursive)
-print('varPoissonRecursive = ',varPoissonRecursive)
\ No newline at end of file
+print('varPoissonRecursive = ',varPoissonRecursive)
+varPoissonPool=np.var(randPoissonPool)
+print('varPoissonPool = ',varPoissonPool)
+
+#number of uniform variables used by the while loop method
+summaryLoop=funStatsSummary(statsLoop);
+print('uniformsPerSample = ',summaryLoop['uniformsPerSample'])
@@ -0,0 +1,111 @@
+# This code generates many Poisson variates (or simulates many Poisson
+# variables) at once using the direct method of exponential inter-arrival
+# times, which is suitable for small Poisson parameter (mu) values.
+#
+# This is a vectorized (or batch) version of funPoissonLoop in
+# PoissonDirect.py. Instead of generating one exponential variable at a
+# time, a block of exponential variables is generated for every variate not
+# yet found (ie pending), and the (cumulative) sums of exponential variables
+# are compared to one. The Poisson variate is the number of sums below one.
+# If the sum of a block is still below one, the sum and number are kept, and
+# another block is generated for that variate only. The width of the blocks
+# is set so most variates are found with the first block.
+#
+# As the width needed grows with mu, the pending variates are put into
+# buckets of similar mu, where the widths needed (the mean plus three
+# standard deviations) differ by at most a factor ratioBucket, and each
+# bucket gets a block with its own width. Then a few large mu values do not
+# make the blocks of all the variates wide.
+#
+# There is no recursion, and each variate can have its own mu.
+#
+# WARNING: This code is for illustration purposes only.
+#
+# In practice, you should *always* use the built-in NumPy function
+# random.poisson.
+#
+# INPUT:
+# mu is a single Poisson parameter (or mean) or an array of Poisson
+# parameters such that mu>=0.
+# numbSim is the number of variates (None to use the size of mu).
+# rng is a random number generator (None to use np.random).
+# numbBlock is the width of the blocks of exponential variables (None to
+# choose it from the largest mu of the pending variates in each bucket).
+# statsRNG is a dictionary of counters from funStatsRejection in the folder
+# PoissonLargeMean (None for no counting).
+# ratioBucket is the largest ratio of the block widths needed in a bucket.
+# OUTPUT:
+# result_n is an array of Poisson variates (that is, instances of Poisson
+# random variables), which are non-negative integers.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+
+# add a block of numbCol exponential variables (with rate mu) to each of the
+# variates indexBlock, and return the variates that are still pending
+def funDirectBlock(mu, indexBlock, numbCol, rng, result_n, sumT):
+    E = rng.exponential(1, (indexBlock.size, numbCol)) / mu[indexBlock, None];
+    T = np.cumsum(E, axis=1); #cumulative sums of exponential variables
+    T += sumT[indexBlock, None];
+
+    #number of sums of exponential variables below one
+    result_n[indexBlock] += np.count_nonzero(T < 1, axis=1);
+    sumT[indexBlock] = T[:, -1];
+    return indexBlock[T[:, -1] < 1]; #continue with another block
+#end function
+
+def funPoissonDirectBatch(mu, numbSim=None, rng=None, numbBlock=None, statsRNG=None,
+                          ratioBucket=1.25):
+    if rng is None:
+        rng = np.random;
+    #end if-statement
+    mu = np.asarray(mu, dtype=float).ravel() if np.ndim(mu) > 0 else np.asarray(mu, dtype=float);
+    if numbSim is None:
+        numbSim = mu.size;
+    #end if-statement
+    mu = np.broadcast_to(mu, (numbSim,));
+
+    result_n = np.zeros(numbSim, dtype=np.int64); #initialize the Poisson variates
+    sumT = np.zeros(numbSim); #sums of exponential variables
+    indexPending = np.flatnonzero(mu > 0); #variates not yet found (zero for mu=0)
+    while (indexPending.size > 0):
+        if numbBlock is None:
+            #mean plus a few standard deviations of each Poisson variate
+            mu_p = mu[indexPending];
+            numbColAll = np.ceil(mu_p + 3 * np.sqrt(mu_p)).astype(np.int64) + 2;
+            #sort the pending variates into buckets of similar widths
+            indexBucket = np.floor(np.log(numbColAll) / np.log(ratioBucket)).astype(np.int64);
+            indexSort = np.argsort(indexBucket, kind='stable');
+            indexSplit = np.flatnonzero(np.diff(indexBucket[indexSort])) + 1;
+            indexBucketAll = np.split(indexSort, indexSplit);
+            numbColBucket = [int(np.max(numbColAll[indexTemp])) for indexTemp in indexBucketAll];
+        else:
+            indexBucketAll = [np.arange(indexPending.size)];
+            numbColBucket = [numbBlock];
+        #end if-statement
+
+        #generate a block of exponential variables for each bucket
+        indexPendingAll = [];
+        for indexTemp, numbCol in zip(indexBucketAll, numbColBucket):
+            indexPendingAll.append(funDirectBlock(mu, indexPending[indexTemp], numbCol, rng,
+                                                  result_n, sumT));
+            if statsRNG is not None:
+                statsRNG['numbUniform'] += indexTemp.size * numbCol;
+            #end if-statement
+        #end for-loop
+        if statsRNG is not None:
+            statsRNG['numbIteration'] += 1;
+        #end if-statement
+
+        indexPending = np.sort(np.concatenate(indexPendingAll));
+    #end while-loop
+    if statsRNG is not None:
+        statsRNG['numbCandidate'] += numbSim;
+        statsRNG['numbSample'] += numbSim;
+    #end if-statement
+
+    return result_n;
+#end function
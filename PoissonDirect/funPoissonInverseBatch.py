@@ -0,0 +1,147 @@
+# This code generates many Poisson variates (or simulates many Poisson
+# variables) at once using the inverse method (of the cumulative
+# distribution function), which is suitable for small Poisson parameter (mu)
+# values, for example, mu<20.
+#
+# For each mu, the Poisson cumulative distribution function (CDF) is found
+# (up to a value where the remaining probability is negligible), along with
+# a guide (or index) table, which gives for each of numbGuide equal
+# intervals of [0,1] the smallest value whose CDF reaches the interval. A
+# uniform variable U then gives a starting value from the guide table, and
+# the Poisson variate is found by stepping up the CDF until it exceeds U,
+# which takes on average less than two steps. Exactly one uniform variable
+# is used for each variate.
+#
+# The tables depend only on mu, so they are kept in a least recently used
+# (LRU) cache (see getPoissonInverseTable), and repeated mu values cost
+# nothing to set up. For an array of mu values with few distinct values
+# (on average at least numbSimTable variates for each distinct value, and no
+# more distinct values than the cache holds), the variates are generated for
+# each distinct value of mu at once. Otherwise, setting up a table for each
+# value costs more than it saves, so all the variates are found at once by
+# sequential search, where the probabilities p(k) are found with
+# p(k+1)=p(k)*mu/(k+1) and added up until their sum exceeds U (see
+# funPoissonInverseSearch).
+#
+# WARNING: This code is for illustration purposes only.
+#
+# In practice, you should *always* use the built-in NumPy function
+# random.poisson.
+#
+# INPUT:
+# mu is a single Poisson parameter (or mean) or an array of Poisson
+# parameters such that mu>=0.
+# numbSim is the number of variates (None to use the size of mu).
+# rng is a random number generator (None to use np.random).
+# statsRNG is a dictionary of counters from funStatsRejection in the folder
+# PoissonLargeMean (None for no counting).
+# numbSimTable is the smallest average number of variates for each distinct
+# mu for using the tables.
+# OUTPUT:
+# result_n is an array of Poisson variates (that is, instances of Poisson
+# random variables), which are non-negative integers.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import scipy
+from functools import lru_cache  # for caching tables
+
+# CDF and guide table for a single mu
+def funPoissonInverseTable(mu, numbGuide=None):
+    #largest value (beyond which the probability is negligible)
+    nMax = int(np.ceil(mu + 12 * np.sqrt(mu) + 12));
+    cdfPoisson = scipy.stats.poisson.cdf(np.arange(nMax + 1), mu);
+    cdfPoisson[-1] = 1; #so every uniform variable is below the last value
+    if numbGuide is None:
+        numbGuide = nMax + 1;
+    #end if-statement
+
+    #smallest value n with CDF(n)>j/numbGuide for each interval j
+    indexGuide = np.searchsorted(cdfPoisson, np.arange(numbGuide) / numbGuide, side='right');
+    cdfPoisson.setflags(write=False);
+    indexGuide.setflags(write=False);
+    return cdfPoisson, indexGuide;
+#end function
+
+# same as funPoissonInverseTable, but cached for the most recent values of mu
+getPoissonInverseTable = lru_cache(maxsize=128)(funPoissonInverseTable);
+
+# Poisson variates for a single mu
+def funPoissonInverseSingle(mu, numbSim, rng):
+    cdfPoisson, indexGuide = getPoissonInverseTable(float(mu));
+    numbGuide = indexGuide.size;
+
+    U = rng.uniform(0, 1, numbSim); #one uniform variable for each variate
+    result_n = indexGuide[(U * numbGuide).astype(np.int64)]; #starting values
+    #step up the CDF (only for variates not yet found)
+    indexPending = np.flatnonzero(cdfPoisson[result_n] <= U);
+    while (indexPending.size > 0):
+        result_n[indexPending] += 1;
+        booleContinue = (cdfPoisson[result_n[indexPending]] <= U[indexPending]);
+        indexPending = indexPending[booleContinue];
+    #end while-loop
+    return result_n;
+#end function
+
+# Poisson variates for an array of mu by sequential search (without tables)
+def funPoissonInverseSearch(mu, rng):
+    U = rng.uniform(0, 1, mu.size); #one uniform variable for each variate
+    p = np.exp(-mu); #probabilities of the current values
+    cdfPoisson = p.copy(); #CDF of the current values
+    result_n = np.zeros(mu.size, dtype=np.int64);
+    #step up the CDF (only for variates not yet found)
+    indexPending = np.flatnonzero(cdfPoisson <= U);
+    k = 0;
+    while (indexPending.size > 0):
+        k = k + 1;
+        p[indexPending] *= mu[indexPending] / k;
+        cdfPoisson[indexPending] += p[indexPending];
+        result_n[indexPending] = k;
+        #stop if the probabilities vanish (ie U is rounded above the CDF)
+        booleContinue = (cdfPoisson[indexPending] <= U[indexPending]) & (p[indexPending] > 0);
+        indexPending = indexPending[booleContinue];
+    #end while-loop
+    return result_n;
+#end function
+
+def funPoissonInverseBatch(mu, numbSim=None, rng=None, statsRNG=None, numbSimTable=1000):
+    if rng is None:
+        rng = np.random;
+    #end if-statement
+    if numbSim is None:
+        numbSim = np.size(mu);
+    #end if-statement
+
+    if np.ndim(mu) == 0:
+        result_n = funPoissonInverseSingle(mu, numbSim, rng);
+    else:
+        mu = np.broadcast_to(np.asarray(mu, dtype=float).ravel(), (numbSim,));
+        muUnique, indexInverse = np.unique(mu, return_inverse=True);
+        numbUnique = muUnique.size;
+        if (numbUnique <= getPoissonInverseTable.cache_info().maxsize) and \
+                (numbUnique * numbSimTable <= numbSim):
+            #generate variates for each distinct mu at once
+            result_n = np.zeros(numbSim, dtype=np.int64);
+            indexSort = np.argsort(indexInverse, kind='stable');
+            indexSplit = np.cumsum(np.bincount(indexInverse, minlength=numbUnique))[:-1];
+            for muTemp, indexTemp in zip(muUnique, np.split(indexSort, indexSplit)):
+                result_n[indexTemp] = funPoissonInverseSingle(muTemp, indexTemp.size, rng);
+            #end for-loop
+        else:
+            #many distinct mu, so use sequential search
+            result_n = funPoissonInverseSearch(mu, rng);
+        #end if-statement
+    #end if-statement
+
+    if statsRNG is not None:
+        statsRNG['numbIteration'] += 1;
+        statsRNG['numbCandidate'] += numbSim;
+        statsRNG['numbUniform'] += numbSim;
+        statsRNG['numbSample'] += numbSim;
+    #end if-statement
+
+    return result_n;
+#end function
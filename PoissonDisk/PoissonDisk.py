@@ -19,10 +19,14 @@ areaTotal = np.pi * r ** 2;  # area of disk
 # Point process parameters
 lambda0 = 100;  # intensity (ie mean density) of the Poisson process
 
+# data type of coordinates -- np.float32 (single precision) halves the memory
+dtypeCoord = np.float64;
+rng = np.random.default_rng();  # random number generator (supports dtype)
+
 # Simulate Poisson point process
-numbPoints = np.random.poisson(lambda0 * areaTotal);  # Poisson number of points
-theta = 2 * np.pi * np.random.uniform(0, 1, numbPoints);  # angular coordinates
-rho = r * np.sqrt(np.random.uniform(0, 1, numbPoints));  # radial coordinates
+numbPoints = rng.poisson(lambda0 * areaTotal);  # Poisson number of points
+theta = 2 * np.pi * rng.random(numbPoints, dtype=dtypeCoord);  # angular coordinates
+rho = r * np.sqrt(rng.random(numbPoints, dtype=dtypeCoord));  # radial coordinates
 
 # Convert from polar to Cartesian coordinates
 xx = rho * np.cos(theta);
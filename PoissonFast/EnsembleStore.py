@@ -0,0 +1,197 @@
+# This code stores many ensembles (or realizations) of a point process on
+# disk, so they can be analyzed later without simulating them again.
+#
+# A store is a folder with the following files:
+# numbPoints.bin -- number of points in each ensemble (int64);
+# indexPoints.bin -- cumulative number of points, starting at zero (int64);
+# coord0.bin, coord1.bin,... -- flat coordinate arrays (eg x and y values);
+# metadata.json -- data type, number of ensembles, number of points and
+# simulation parameters (eg window, lambda0 and seed).
+#
+# The binary files are raw arrays, so they are written incrementally by
+# EnsembleWriter (one batch of ensembles at a time) and read back by
+# funEnsembleLoad with np.memmap. Loading a store is then instant, and only
+# the parts of the files used by the ensembles accessed are read from disk.
+#
+# The metadata is written last, when all ensembles have been written, and
+# any old metadata is removed before the data files are written (eg when a
+# folder is reused). So a store whose writing failed cannot be loaded.
+#
+# EXAMPLE:
+# with EnsembleWriter(pathStore,{'windowSim':windowSim,'lambda0':lambda0,'seedRand':seedRand}) as writer:
+#     for ppEnsemble in funPoissonFastChunks(numbSim,lambda0,windowSim,2**28,seedRand):
+#         writer.append(ppEnsemble);
+# ppEnsemble=funEnsembleLoad(pathStore); #PoissonEnsemble backed by np.memmap
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import os  # for file paths
+import json  # for reading and writing metadata
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+
+class EnsembleWriter:
+    # pathStore is the folder of the store (created if needed).
+    # dictParam is a dictionary of simulation parameters (saved as JSON).
+    # dtypeCoord is the data type of the coordinates (None to use the data
+    # type of the first ensembles appended, eg np.float32).
+    def __init__(self, pathStore, dictParam=None, dtypeCoord=None):
+        self.pathStore = pathStore;
+        self.dictParam = {} if dictParam is None else dict(dictParam);
+        self.dtypeCoord = None if dtypeCoord is None else np.dtype(dtypeCoord);
+        self.numbSim = 0;
+        self.numbPointsTotal = 0;
+        self.numbDim = None;
+
+        os.makedirs(pathStore, exist_ok=True);
+        funEnsembleMetaRemove(pathStore);  # old store (if any) is no longer valid
+        self.fileNumb = open(os.path.join(pathStore, 'numbPoints.bin'), 'wb');
+        self.fileIndex = open(os.path.join(pathStore, 'indexPoints.bin'), 'wb');
+        np.zeros(1, dtype=np.int64).tofile(self.fileIndex);  # first index is zero
+        self.fileCoordAll = [];
+    #end function
+
+    # append the ensembles of a PoissonEnsemble (or the arrays numbPoints and
+    # coordAll, eg as given by PoissonTiled.py)
+    def append(self, ppEnsemble, *coordAll):
+        if isinstance(ppEnsemble, PoissonEnsemble):
+            numbPoints = ppEnsemble.numbPoints;
+            coordAll = ppEnsemble.coordAll;
+        else:
+            numbPoints = np.asarray(ppEnsemble, dtype=np.int64);
+        #end if-statement
+
+        if self.numbDim is None:
+            # open coordinate files with the first batch
+            self.numbDim = len(coordAll);
+            if self.dtypeCoord is None:
+                self.dtypeCoord = np.asarray(coordAll[0]).dtype if self.numbDim > 0 else np.dtype(np.float64);
+            #end if-statement
+            self.fileCoordAll = [open(os.path.join(self.pathStore, 'coord%d.bin' % dd), 'wb')
+                                 for dd in range(self.numbDim)];
+        elif len(coordAll) != self.numbDim:
+            raise ValueError('Number of coordinates does not match previous ensembles.');
+        #end if-statement
+
+        numbPoints = np.asarray(numbPoints, dtype=np.int64);
+        numbPoints.tofile(self.fileNumb);
+        (self.numbPointsTotal + np.cumsum(numbPoints)).tofile(self.fileIndex);
+        for dd in range(self.numbDim):
+            np.asarray(coordAll[dd], dtype=self.dtypeCoord).tofile(self.fileCoordAll[dd]);
+        #end for-loop
+
+        self.numbSim = self.numbSim + numbPoints.size;
+        self.numbPointsTotal = self.numbPointsTotal + int(np.sum(numbPoints));
+    #end function
+
+    # close the data files (without writing metadata)
+    def closeFiles(self):
+        for fileTemp in [self.fileNumb, self.fileIndex] + self.fileCoordAll:
+            fileTemp.close();
+        #end for-loop
+    #end function
+
+    def close(self):
+        self.closeFiles();
+        # metadata is written last, so an unfinished store cannot be loaded
+        funEnsembleMetaWrite(self.pathStore, self.dtypeCoord, self.numbDim or 0,
+                             self.numbSim, self.numbPointsTotal, self.dictParam);
+    #end function
+
+    def __enter__(self):
+        return self;
+
+    # an error while writing leaves the store without metadata (so unloadable)
+    def __exit__(self, typeExc, valueExc, traceExc):
+        if typeExc is None:
+            self.close();
+        else:
+            self.closeFiles();
+        #end if-statement
+
+#end class
+
+# convert NumPy numbers/arrays and seed sequences for saving as JSON
+def funJSONDefault(valueTemp):
+    if isinstance(valueTemp, np.random.SeedSequence):
+        return valueTemp.entropy;
+    if isinstance(valueTemp, np.ndarray):
+        return valueTemp.tolist();
+    if isinstance(valueTemp, np.generic):
+        return valueTemp.item();
+    raise TypeError('Cannot save ' + str(type(valueTemp)) + ' as JSON.');
+#end function
+
+# write the metadata of a store (the last step of writing a store)
+def funEnsembleMetaWrite(pathStore, dtypeCoord, numbDim, numbSim, numbPointsTotal, dictParam=None):
+    dtypeCoord = np.dtype(np.float64) if dtypeCoord is None else np.dtype(dtypeCoord);
+    dictMeta = {'dtypeCoord': dtypeCoord.str, 'numbDim': numbDim,
+                'numbSim': int(numbSim), 'numbPointsTotal': int(numbPointsTotal),
+                'param': {} if dictParam is None else dict(dictParam)};
+    with open(os.path.join(pathStore, 'metadata.json'), 'w') as fileMeta:
+        json.dump(dictMeta, fileMeta, indent=2, default=funJSONDefault);
+    #end with-statement
+#end function
+
+# remove the metadata of a store (if it exists) before its data files are
+# written again, so an unfinished store cannot be loaded with old metadata
+def funEnsembleMetaRemove(pathStore):
+    pathMeta = os.path.join(pathStore, 'metadata.json');
+    if os.path.exists(pathMeta):
+        os.remove(pathMeta);
+    #end if-statement
+#end function
+
+# create a store with the numbers of points of all ensembles and empty
+# (ie zero) coordinate files of the right size, which can then be filled
+# in any order (eg by several processes) with memory maps (see
+# funPoissonFastParallel.py); the metadata is written by funEnsembleMetaWrite
+def funEnsembleCreate(pathStore, numbPoints, numbDim, dtypeCoord=np.float64):
+    os.makedirs(pathStore, exist_ok=True);
+    funEnsembleMetaRemove(pathStore);  # old store (if any) is no longer valid
+    numbPoints = np.asarray(numbPoints, dtype=np.int64);
+    indexPoints = np.zeros(numbPoints.size + 1, dtype=np.int64);
+    np.cumsum(numbPoints, out=indexPoints[1:]);
+    numbPoints.tofile(os.path.join(pathStore, 'numbPoints.bin'));
+    indexPoints.tofile(os.path.join(pathStore, 'indexPoints.bin'));
+    numbBytes = int(indexPoints[-1]) * np.dtype(dtypeCoord).itemsize;
+    for dd in range(numbDim):
+        with open(os.path.join(pathStore, 'coord%d.bin' % dd), 'wb') as fileCoord:
+            fileCoord.truncate(numbBytes);
+        #end with-statement
+    #end for-loop
+    return indexPoints;
+#end function
+
+# read the metadata of a store
+def funEnsembleMeta(pathStore):
+    with open(os.path.join(pathStore, 'metadata.json'), 'r') as fileMeta:
+        dictMeta = json.load(fileMeta);
+    #end with-statement
+    return dictMeta;
+#end function
+
+# open a store as a PoissonEnsemble backed by (read-only) memory maps
+def funEnsembleLoad(pathStore, modeMap='r'):
+    dictMeta = funEnsembleMeta(pathStore);
+    numbSim = dictMeta['numbSim'];
+    numbPointsTotal = dictMeta['numbPointsTotal'];
+    dtypeCoord = np.dtype(dictMeta['dtypeCoord']);
+
+    # np.memmap cannot map empty files
+    def funMap(nameFile, dtypeTemp, numbValues):
+        if numbValues == 0:
+            return np.zeros(0, dtype=dtypeTemp);
+        return np.memmap(os.path.join(pathStore, nameFile), dtype=dtypeTemp,
+                         mode=modeMap, shape=(numbValues,));
+    #end function
+
+    numbPoints = funMap('numbPoints.bin', np.int64, numbSim);
+    indexPoints = funMap('indexPoints.bin', np.int64, numbSim + 1);
+    coordAll = [funMap('coord%d.bin' % dd, dtypeCoord, numbPointsTotal)
+                for dd in range(dictMeta['numbDim'])];
+
+    return PoissonEnsemble(numbPoints, *coordAll, indexPoints=indexPoints);
+#end function
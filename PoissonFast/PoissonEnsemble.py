@@ -0,0 +1,135 @@
+# This code defines a compact (ragged) container for many realizations (or
+# ensembles) of a point process, such as those generated by Method A in
+# PoissonFast.py.
+#
+# Instead of splitting the points into a list of (many small) arrays, the
+# container keeps one flat array for each coordinate and the cumulative
+# number of points, which gives the index of the first point of each
+# ensemble. Accessing an ensemble then only creates views of the flat
+# arrays, so no coordinates are copied.
+#
+# EXAMPLE:
+# ppEnsemble=PoissonEnsemble(numbPointsA,xxAll,yyAll);
+# xx,yy=ppEnsemble[7]; #coordinates of the eighth ensemble (views)
+# ppEnsembleFirst=ppEnsemble[:1000]; #first 1000 ensembles (views)
+# for xx,yy in ppEnsemble: ...
+#
+# INPUT:
+# numbPoints is an array of the number of points in each ensemble.
+# coordAll are the flat coordinate arrays (eg xxAll and yyAll), where the
+# points of each ensemble are stored consecutively.
+# indexPoints (optional) is the cumulative number of points (starting at
+# zero) if it has already been calculated (eg stored on disk).
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+
+class PoissonEnsemble:
+    def __init__(self, numbPoints, *coordAll, indexPoints=None):
+        self.numbPoints = np.asarray(numbPoints, dtype=np.int64);
+        # index of the first point of each ensemble (with the total number
+        # of points appended), so ensemble ii is indexPoints[ii]:indexPoints[ii+1]
+        if indexPoints is None:
+            self.indexPoints = np.zeros(self.numbPoints.size + 1, dtype=np.int64);
+            np.cumsum(self.numbPoints, out=self.indexPoints[1:]);
+        else:
+            self.indexPoints = np.asarray(indexPoints, dtype=np.int64);
+        #end if-statement
+        self.coordAll = tuple(np.asarray(coord) for coord in coordAll);
+
+        for coord in self.coordAll:
+            if coord.shape[0] != self.indexPoints[-1]:
+                raise ValueError('Number of coordinates does not match the total number of points.');
+            #end if-statement
+        #end for-loop
+    #end function
+
+    @property
+    def numbSim(self):
+        return self.numbPoints.size;
+
+    @property
+    def numbDim(self):
+        return len(self.coordAll);
+
+    @property
+    def numbPointsTotal(self):
+        return int(self.indexPoints[-1]);
+
+    # flat coordinate arrays (across all ensembles)
+    @property
+    def xx(self):
+        return self.coordAll[0];
+
+    @property
+    def yy(self):
+        return self.coordAll[1];
+
+    @property
+    def zz(self):
+        return self.coordAll[2];
+
+    def __len__(self):
+        return self.numbSim;
+
+    def __iter__(self):
+        indexPoints = self.indexPoints;
+        for ss in range(self.numbSim):
+            iStart = indexPoints[ss];
+            iEnd = indexPoints[ss + 1];
+            yield tuple(coord[iStart:iEnd] for coord in self.coordAll);
+        #end for-loop
+    #end function
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indexStart, indexStop, indexStep = index.indices(self.numbSim);
+            if indexStep == 1:
+                # consecutive ensembles so use views of the flat arrays
+                indexStop = max(indexStart, indexStop);
+                iStart = self.indexPoints[indexStart];
+                iEnd = self.indexPoints[indexStop];
+                return PoissonEnsemble(self.numbPoints[indexStart:indexStop],
+                                       *(coord[iStart:iEnd] for coord in self.coordAll),
+                                       indexPoints=self.indexPoints[indexStart:indexStop + 1] - iStart);
+            #end if-statement
+            # non-consecutive ensembles so the points need to be gathered (copied)
+            return self.take(np.arange(indexStart, indexStop, indexStep));
+        #end if-statement
+
+        ss = int(index);
+        if ss < 0:
+            ss = ss + self.numbSim;
+        #end if-statement
+        if (ss < 0) or (ss >= self.numbSim):
+            raise IndexError('Ensemble index out of range.');
+        #end if-statement
+        iStart = self.indexPoints[ss];
+        iEnd = self.indexPoints[ss + 1];
+        return tuple(coord[iStart:iEnd] for coord in self.coordAll);
+    #end function
+
+    # gather (by copying) the ensembles given by an array of indices
+    def take(self, indexSim):
+        indexSim = np.asarray(indexSim, dtype=np.int64);
+        numbPointsTake = self.numbPoints[indexSim];
+        # index of every point belonging to the chosen ensembles
+        indexFirst = np.repeat(self.indexPoints[indexSim], numbPointsTake);
+        indexLocal = np.arange(indexFirst.size) - np.repeat(
+            np.cumsum(numbPointsTake) - numbPointsTake, numbPointsTake);
+        indexTake = indexFirst + indexLocal;
+        return PoissonEnsemble(numbPointsTake, *(coord[indexTake] for coord in self.coordAll));
+    #end function
+
+    # index of the ensemble to which each point belongs
+    def getIndexSim(self):
+        return np.repeat(np.arange(self.numbSim), self.numbPoints);
+
+    # convert to a list of arrays for each coordinate (as done by np.split)
+    def toLists(self):
+        return tuple(np.split(coord, self.indexPoints[1:-1], axis=0) for coord in self.coordAll);
+
+#end class
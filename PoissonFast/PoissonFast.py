@@ -7,6 +7,12 @@
 # positions all the points (across all ensembles) in one step. All the
 # points are then are then separated accordingly into ensembles.
 #
+# The ensembles of Method A are kept in a PoissonEnsemble object, which stores
+# the flat x/y arrays and the (cumulative) index of the points, so each
+# ensemble is accessed as a view instead of creating (many small) arrays.
+# If all the points do not fit in memory, use funPoissonFastChunks, which
+# runs Method A on batches of ensembles with a memory budget.
+#
 # Method B iterates through a for-loop, and for each iteration, it randomly
 # generates a Poisson variable and positions the points for each ensemble.
 #
@@ -23,6 +29,8 @@ import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # for plotting
 from matplotlib import collections  as mc  # for plotting line segments
 import time
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+from funEnsembleReduce import funEnsembleMin, funEnsembleCount # type: ignore
 
 ###START Parameters START###
 numbSim = 10 ** 6;  # number of simulations
@@ -30,6 +38,10 @@ numbSim = 10 ** 6;  # number of simulations
 # Point process parameters
 lambda0 = 20;  # intensity (ie mean density) of Poisson point process
 
+# data type of coordinates -- np.float32 (single precision) halves the memory
+dtypeCoord = np.float64;
+rng = np.random.default_rng();  # random number generator (supports dtype)
+
 # Simulation window parameters
 xMin = 0;
 xMax = 1;
@@ -44,22 +56,29 @@ massTotal = areaTotal * lambda0;  # total measure/mass of the point process
 ###START Simulation section START###
 ###START Method A: Generate *all* ensembles at once START###
 t0 = time.time();  # start timing
-numbPointsA = np.random.poisson(massTotal, numbSim);  # Poisson number of points
+numbPointsA = rng.poisson(massTotal, numbSim);  # Poisson number of points
 numbPointsTotal = sum(numbPointsA);
 # uniform x/y coordinates of Poisson points
-xxAll = xDelta * (np.random.rand(numbPointsTotal)) + xMin;  # x coordinates of Poisson points
-yyAll = yDelta * (np.random.rand(numbPointsTotal)) + yMin;  # y coordinates of Poisson points
+xxAll = xDelta * (rng.random(numbPointsTotal, dtype=dtypeCoord)) + xMin;  # x coordinates of Poisson points
+yyAll = yDelta * (rng.random(numbPointsTotal, dtype=dtypeCoord)) + yMin;  # y coordinates of Poisson points
 
-# convert Poisson point processes into lists
-indexPoints = np.cumsum(numbPointsA[0:-1]);  # index for creating lists
-xxListA = np.split(xxAll, indexPoints, axis=0);  # list for x values
-yyListA = np.split(yyAll, indexPoints, axis=0)  # list for y values
-numbListA = np.split(numbPointsA, 1);
+# convert Poisson point processes into a ragged ensemble (no copying)
+ppEnsembleA = PoissonEnsemble(numbPointsA, xxAll, yyAll);
+# xxA, yyA = ppEnsembleA[ss] gives the x/y values of ensemble ss (as views)
+# to create lists (slow for many ensembles), use instead:
+# xxListA, yyListA = ppEnsembleA.toLists();
 t1 = time.time();  # finish timing
 print('Elapsed time is ', (t1 - t0), 'seconds.');
 
 ###END Method A: Generate *all* ensembles at once END###
 
+###START Statistics of Method A ensembles START###
+# calculate statistics of each ensemble directly on the flat arrays
+distMinA = funEnsembleMin(np.hypot(xxAll, yyAll), numbPointsA);  # nearest distance to the origin
+booleInside = (xxAll < (xMin + xDelta / 2)) & (yyAll < (yMin + yDelta / 2));
+numbInsideA = funEnsembleCount(booleInside, numbPointsA);  # number of points in a quarter
+###END Statistics of Method A ensembles END###
+
 ###START Method B: Generate each ensemble separately START###
 t0 = time.time();  # start timing
 xxListB = [];
@@ -67,9 +86,9 @@ yyListB = [];
 numbPointsB = np.zeros(numbSim);
 # loop through for all ensembles
 for ss in range(numbSim):
-    numbPointsTemp = np.random.poisson(massTotal);  # Poisson number of points
-    xxListB.append(xDelta * (np.random.rand(numbPointsTemp)) + xMin);  # x coordinates of Poisson points
-    yyListB.append(yDelta * (np.random.rand(numbPointsTemp)) + yMin);  # y coordinates of Poisson points
+    numbPointsTemp = rng.poisson(massTotal);  # Poisson number of points
+    xxListB.append(xDelta * (rng.random(numbPointsTemp, dtype=dtypeCoord)) + xMin);  # x coordinates of Poisson points
+    yyListB.append(yDelta * (rng.random(numbPointsTemp, dtype=dtypeCoord)) + yMin);  # y coordinates of Poisson points
     numbPointsB[ss] = numbPointsTemp;
 
 t1 = time.time();  # finish timing
@@ -87,8 +106,7 @@ print('Elapsed time is ', (t1 - t0), 'seconds.');
 # ppStructPoissonB = [ structtype() for ii in range(numbSim)];
 # for ii in range(numbSim):
 #    #structure array for point patterns from Method A
-#    ppStructPoissonA[ii].xx=xxListA[ii];
-#    ppStructPoissonA[ii].yy=yyListA[ii];
+#    ppStructPoissonA[ii].xx,ppStructPoissonA[ii].yy=ppEnsembleA[ii];
 #    ppStructPoissonA[ii].n=numbPointsA[ii];
 #    ppStructPoissonA[ii].window=windowSim;
 #        
@@ -0,0 +1,156 @@
+# This code defines simulation windows for (homogeneous) Poisson point
+# processes, namely a rectangle, disk, triangle, circle, sphere and
+# n-dimensional sphere, based on the code in the folders PoissonRectangle,
+# PoissonDisk, PoissonTriangle, PoissonCircle, PoissonSphere and
+# Poisson_nSphere.
+#
+# Each window has the attributes measure (ie length, area or volume) and
+# numbDim (number of coordinates), and the method sample, which uniformly
+# positions numbPointsTotal points in one (vectorized) step. The points are
+# returned as a tuple of coordinate arrays (eg xx and yy).
+#
+# The function funPoissonWindowA then uses Method A in PoissonFast.py to
+# simulate many ensembles on any of the windows at once.
+#
+# EXAMPLE:
+# windowSim=WindowTriangle(0,0,1,0,1,1);
+# ppEnsemble=funPoissonWindowA(windowSim,lambda0,numbSim,seedRand);
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from scipy.special import gamma  # gamma function
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+
+class WindowRectangle:
+    def __init__(self, xMin, xMax, yMin, yMax):
+        self.xMin = xMin;
+        self.yMin = yMin;
+        self.xDelta = xMax - xMin;
+        self.yDelta = yMax - yMin;  # rectangle dimensions
+        self.measure = self.xDelta * self.yDelta;  # area of rectangle
+        self.numbDim = 2;
+
+    def sample(self, numbPointsTotal, rng, dtypeCoord=np.float64):
+        xx = self.xDelta * rng.random(numbPointsTotal, dtype=dtypeCoord) + self.xMin;
+        yy = self.yDelta * rng.random(numbPointsTotal, dtype=dtypeCoord) + self.yMin;
+        return xx, yy;
+#end class
+
+class WindowDisk:
+    def __init__(self, r, xx0=0, yy0=0):
+        self.r = r;  # radius of disk
+        self.xx0 = xx0;
+        self.yy0 = yy0;  # centre of disk
+        self.measure = np.pi * r ** 2;  # area of disk
+        self.numbDim = 2;
+
+    def sample(self, numbPointsTotal, rng, dtypeCoord=np.float64):
+        theta = 2 * np.pi * rng.random(numbPointsTotal, dtype=dtypeCoord);  # angular coordinates
+        rho = self.r * np.sqrt(rng.random(numbPointsTotal, dtype=dtypeCoord));  # radial coordinates
+        # convert from polar to Cartesian coordinates and shift centre
+        xx = rho * np.cos(theta) + self.xx0;
+        yy = rho * np.sin(theta) + self.yy0;
+        return xx, yy;
+#end class
+
+class WindowTriangle:
+    # points A,B,C of a triangle
+    def __init__(self, xA, yA, xB, yB, xC, yC):
+        self.xA, self.yA = xA, yA;
+        self.xB, self.yB = xB, yB;
+        self.xC, self.yC = xC, yC;
+        # area of triangle (from the cross product of two sides)
+        self.measure = abs((xB - xA) * (yC - yA) - (xC - xA) * (yB - yA)) / 2;
+        self.numbDim = 2;
+
+    def sample(self, numbPointsTotal, rng, dtypeCoord=np.float64):
+        sqrtU = np.sqrt(rng.random(numbPointsTotal, dtype=dtypeCoord));  # square root of uniform variables
+        V = rng.random(numbPointsTotal, dtype=dtypeCoord);  # uniform random variables
+        # places points uniformly on triangle (the weight of vertex A is
+        # 1-sqrt(U), which is also correct when A is not the origin)
+        xx = (1 - sqrtU) * self.xA + sqrtU * (1 - V) * self.xB + sqrtU * V * self.xC;
+        yy = (1 - sqrtU) * self.yA + sqrtU * (1 - V) * self.yB + sqrtU * V * self.yC;
+        return xx, yy;
+#end class
+
+class WindowCircle:
+    def __init__(self, r, xx0=0, yy0=0):
+        self.r = r;  # radius of circle
+        self.xx0 = xx0;
+        self.yy0 = yy0;  # centre of circle
+        self.measure = 2 * np.pi * r;  # circumference of circle
+        self.numbDim = 2;
+
+    def sample(self, numbPointsTotal, rng, dtypeCoord=np.float64):
+        theta = 2 * np.pi * rng.random(numbPointsTotal, dtype=dtypeCoord);  # angular coordinates
+        xx = self.r * np.cos(theta) + self.xx0;
+        yy = self.r * np.sin(theta) + self.yy0;
+        return xx, yy;
+#end class
+
+class WindowSphere:
+    # booleInside is True to place points *inside* the sphere (ie a ball)
+    def __init__(self, r, xx0=0, yy0=0, zz0=0, booleInside=False):
+        self.r = r;  # radius of sphere
+        self.xx0 = xx0;
+        self.yy0 = yy0;
+        self.zz0 = zz0;  # centre of sphere
+        self.booleInside = booleInside;
+        if booleInside:
+            self.measure = 4 / 3 * np.pi * r ** 3;  # volume of ball
+        else:
+            self.measure = 4 * np.pi * r ** 2;  # area of sphere
+        #end if-statement
+        self.numbDim = 3;
+
+    def sample(self, numbPointsTotal, rng, dtypeCoord=np.float64):
+        # spherical coordinates
+        phi = 2 * np.pi * rng.random(numbPointsTotal, dtype=dtypeCoord);  # azimuth angles
+        V = 2 * rng.random(numbPointsTotal, dtype=dtypeCoord) - 1;  # cosine of polar angles
+        if self.booleInside:
+            rho = self.r * rng.random(numbPointsTotal, dtype=dtypeCoord) ** (1 / 3);  # radial distances
+        else:
+            rho = self.r;  # fixed radius
+        #end if-statement
+        sinTheta = np.sqrt(1 - V ** 2);
+        xx = rho * sinTheta * np.cos(phi) + self.xx0;
+        yy = rho * sinTheta * np.sin(phi) + self.yy0;
+        zz = rho * V + self.zz0;
+        return xx, yy, zz;
+#end class
+
+class WindowNSphere:
+    # surface of a numbDim-dimensional ball (ie a (numbDim-1)-sphere)
+    def __init__(self, numbDim, r, centre=None):
+        self.numbDim = numbDim;  # number of dimensions of embedding
+        self.r = r;  # radius of sphere
+        self.centre = np.zeros(numbDim) if centre is None else np.asarray(centre);
+        # surface area of numbDim-dimensional ball
+        self.measure = 2 * np.pi ** (numbDim / 2) * r ** (numbDim - 1) / gamma(numbDim / 2);
+
+    def sample(self, numbPointsTotal, rng, dtypeCoord=np.float64):
+        # normal variables (each row is a coordinate), rescaled by Euclidean norms
+        xxRand = rng.standard_normal((self.numbDim, numbPointsTotal), dtype=dtypeCoord);
+        normRand = np.sqrt(np.sum(xxRand ** 2, axis=0));  # Euclidean norms
+        xxRand *= self.r / normRand;
+        xxRand += self.centre[:, None];  # shift centre of sphere
+        return tuple(xxRand);
+#end class
+
+# simulate numbSim ensembles on windowSim with Method A in PoissonFast.py
+def funPoissonWindowA(windowSim, lambda0, numbSim, seedRand=None, dtypeCoord=np.float64):
+    # random number streams for the numbers of points and coordinates
+    seedN, seedCoord = np.random.SeedSequence(seedRand).spawn(2);
+    rngN = np.random.default_rng(seedN);
+    rngCoord = np.random.default_rng(seedCoord);
+
+    massTotal = windowSim.measure * lambda0;  # total measure/mass of the point process
+    numbPoints = rngN.poisson(massTotal, numbSim);  # Poisson number of points
+    numbPointsTotal = np.sum(numbPoints);
+    coordAll = windowSim.sample(numbPointsTotal, rngCoord, dtypeCoord);
+
+    return PoissonEnsemble(numbPoints, *coordAll);
+#end function
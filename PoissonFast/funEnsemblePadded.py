@@ -0,0 +1,82 @@
+# This code converts many ensembles (or realizations) of a point process,
+# stored as a (ragged) PoissonEnsemble, into a padded (dense) array of shape
+# (numbSim,numbPointsCap,numbDim) with a boolean mask of valid points, so
+# per-ensemble calculations can be done with plain NumPy broadcasting.
+#
+# If an ensemble has more than numbPointsCap points, only its first
+# numbPointsCap points are padded, and its index is returned in
+# indexOverflow, so these (rare) ensembles can be handled separately (eg
+# with ppEnsemble.take(indexOverflow)).
+#
+# The function funChooseLayout uses the tail of the Poisson distribution to
+# choose a cap and decide whether the padded layout wastes too much memory
+# compared to the ragged layout.
+#
+# EXAMPLE (sum of path-loss terms at the origin for each ensemble):
+# coordPadded,booleValid,indexOverflow=funEnsemblePadded(ppEnsemble,numbPointsCap);
+# distPadded=np.sqrt(np.sum(coordPadded**2,axis=2));
+# sumPathLoss=np.sum(np.where(booleValid,distPadded**(-4),0),axis=1);
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from scipy.stats import poisson  # for the Poisson distribution
+
+# INPUT:
+# ppEnsemble is a PoissonEnsemble.
+# numbPointsCap is the maximum number of points of each ensemble (None to
+# use the largest number of points).
+# valueFill is the value of the padded (ie invalid) entries.
+# OUTPUT:
+# coordPadded is an array of shape (numbSim,numbPointsCap,numbDim).
+# booleValid is a boolean array of shape (numbSim,numbPointsCap).
+# indexOverflow are the indices of ensembles with more than numbPointsCap points.
+def funEnsemblePadded(ppEnsemble, numbPointsCap=None, valueFill=np.nan):
+    numbPoints = ppEnsemble.numbPoints;
+    numbSim = ppEnsemble.numbSim;
+    if numbPointsCap is None:
+        numbPointsCap = int(np.max(numbPoints)) if numbSim > 0 else 0;
+    #end if-statement
+
+    # ensemble of each point and its position within the ensemble
+    indexSim = ppEnsemble.getIndexSim();
+    indexLocal = np.arange(ppEnsemble.numbPointsTotal) - np.repeat(ppEnsemble.indexPoints[:-1], numbPoints);
+    booleKeep = (indexLocal < numbPointsCap);
+    indexSim = indexSim[booleKeep];
+    indexLocal = indexLocal[booleKeep];
+
+    dtypeCoord = np.result_type(*ppEnsemble.coordAll) if ppEnsemble.numbDim > 0 else np.float64;
+    coordPadded = np.full((numbSim, numbPointsCap, ppEnsemble.numbDim), valueFill, dtype=dtypeCoord);
+    for dd in range(ppEnsemble.numbDim):
+        coordPadded[indexSim, indexLocal, dd] = ppEnsemble.coordAll[dd][booleKeep];
+    #end for-loop
+
+    booleValid = (np.arange(numbPointsCap) < numbPoints[:, None]);
+    indexOverflow = np.flatnonzero(numbPoints > numbPointsCap);
+
+    return coordPadded, booleValid, indexOverflow;
+#end function
+
+# smallest cap such that the probability of any of the numbSim ensembles
+# having more points than the cap is (about) probOverflow or less
+def funNumbPointsCap(massTotal, numbSim, probOverflow=10 ** (-3)):
+    # P(max N>n) <= numbSim*P(N>n) (ie union bound)
+    numbPointsCap = poisson.isf(probOverflow / max(numbSim, 1), massTotal);
+    return int(numbPointsCap);
+#end function
+
+# choose the padded or ragged layout for numbSim ensembles with Poisson
+# numbers of points of mean massTotal, where the padded layout is chosen if
+# it uses at most ratioWasteMax times the (average) memory of the ragged layout
+def funChooseLayout(massTotal, numbSim, ratioWasteMax=2, probOverflow=10 ** (-3)):
+    numbPointsCap = funNumbPointsCap(massTotal, numbSim, probOverflow);
+    ratioWaste = numbPointsCap / max(massTotal, 1);  # padded memory over ragged memory
+    if ratioWaste <= ratioWasteMax:
+        choiceLayout = 'padded';
+    else:
+        choiceLayout = 'ragged';
+    #end if-statement
+    return choiceLayout, numbPointsCap;
+#end function
@@ -0,0 +1,82 @@
+# This code calculates statistics of each ensemble (or realization) of a
+# point process, where the ensembles are stored (as in Method A of
+# PoissonFast.py) in flat arrays with the number of points in each ensemble.
+#
+# The statistics are found with segment reductions (ie ufunc.reduceat), so
+# no per-ensemble arrays or lists are created. Empty ensembles are
+# given the value valueEmpty (so integer values with valueEmpty=inf or -inf
+# give floats).
+#
+# EXAMPLE (nearest distance to the origin in each ensemble):
+# distAll=np.hypot(xxAll,yyAll);
+# distMin=funEnsembleMin(distAll,numbPointsA);
+#
+# INPUT:
+# valuesAll is a flat array of values for the points of all ensembles.
+# numbPoints is an array of the number of points in each ensemble.
+# OUTPUT:
+# an array of numbSim values, one for each ensemble.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+
+# reduce the values of each ensemble with a (binary) NumPy ufunc
+def funEnsembleReduce(valuesAll, numbPoints, funUfunc, valueEmpty=0):
+    valuesAll = np.asarray(valuesAll);
+    numbPoints = np.asarray(numbPoints);
+    numbSim = numbPoints.size;
+    if (np.sum(numbPoints) != valuesAll.shape[0]):
+        raise ValueError('Number of values does not match the total number of points.');
+    #end if-statement
+    # index of the first point of each ensemble
+    indexStart = np.cumsum(numbPoints) - numbPoints;
+    booleNonEmpty = (numbPoints > 0);
+
+    dtypeReduced = funUfunc(valuesAll[:0], valuesAll[:0]).dtype;
+    if (not np.isfinite(valueEmpty)) and (not np.issubdtype(dtypeReduced, np.inexact)):
+        # integer values cannot hold inf (or nan) for empty ensembles
+        dtypeReduced = np.float64;
+    #end if-statement
+    valuesReduced = np.full(numbSim, valueEmpty, dtype=dtypeReduced);
+    if np.any(booleNonEmpty):
+        # Using only the starts of non-empty ensembles, each segment of
+        # reduceat ends exactly where the ensemble ends.
+        valuesReduced[booleNonEmpty] = funUfunc.reduceat(valuesAll, indexStart[booleNonEmpty]);
+    #end if-statement
+    return valuesReduced;
+#end function
+
+def funEnsembleSum(valuesAll, numbPoints):
+    return funEnsembleReduce(valuesAll, numbPoints, np.add, 0);
+
+def funEnsembleMin(valuesAll, numbPoints, valueEmpty=np.inf):
+    return funEnsembleReduce(valuesAll, numbPoints, np.minimum, valueEmpty);
+
+def funEnsembleMax(valuesAll, numbPoints, valueEmpty=-np.inf):
+    return funEnsembleReduce(valuesAll, numbPoints, np.maximum, valueEmpty);
+
+# count the points in each ensemble satisfying a condition (eg in a sub-region)
+def funEnsembleCount(booleAll, numbPoints):
+    return funEnsembleReduce(np.asarray(booleAll, dtype=np.int64), numbPoints, np.add, 0);
+
+# index (within each ensemble) of the point with the smallest value, where
+# empty ensembles are given the index -1
+def funEnsembleArgMin(valuesAll, numbPoints):
+    valuesAll = np.asarray(valuesAll);
+    numbPoints = np.asarray(numbPoints);
+    numbPointsTotal = valuesAll.size;
+
+    # (empty ensembles are not used, so any value of valuesAll's type will do)
+    valuesMin = funEnsembleReduce(valuesAll, numbPoints, np.minimum, valueEmpty=0);
+    indexStart = np.cumsum(numbPoints) - numbPoints;
+    # position of each point within its ensemble
+    indexLocal = np.arange(numbPointsTotal) - np.repeat(indexStart, numbPoints);
+    # only points equal to the minimum of their ensemble are candidates
+    booleMin = (valuesAll == np.repeat(valuesMin, numbPoints));
+    indexCandidate = np.where(booleMin, indexLocal, numbPointsTotal);
+    indexMin = funEnsembleReduce(indexCandidate, numbPoints, np.minimum, -1);
+    return indexMin;
+#end function
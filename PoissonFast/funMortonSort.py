@@ -0,0 +1,80 @@
+# This code sorts the points of each ensemble (or realization) of a point
+# process along a Z-order (or Morton) curve, so points that are close in
+# the plane are (mostly) close in memory. This makes later neighbour
+# calculations, such as building a k-d tree or binning points on a grid,
+# more cache friendly.
+#
+# The Morton key of a point is found by scaling its x/y coordinates to
+# integers with numbBits bits and interleaving the bits of the two integers.
+# The keys are calculated for all points (of all ensembles) at once, and the
+# points are then sorted within each ensemble by combining the keys with
+# the ensemble indices.
+#
+# EXAMPLE:
+# ppEnsembleSorted=funEnsembleMortonSort(ppEnsemble,windowSim);
+# xxSorted,yySorted=funMortonSort(xx,yy,windowSim); #single realization
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+
+# spread the (lower 32) bits of integers so there is a zero bit between
+# each pair of bits (eg 1011 becomes 1000101)
+def funSpreadBits(intValues):
+    intValues = intValues.astype(np.uint64) & np.uint64(0x00000000FFFFFFFF);
+    intValues = (intValues | (intValues << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF);
+    intValues = (intValues | (intValues << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF);
+    intValues = (intValues | (intValues << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F);
+    intValues = (intValues | (intValues << np.uint64(2))) & np.uint64(0x3333333333333333);
+    intValues = (intValues | (intValues << np.uint64(1))) & np.uint64(0x5555555555555555);
+    return intValues;
+#end function
+
+# Morton keys of points in the rectangle windowSim=[xMin,xMax,yMin,yMax]
+def funMortonKeys(xx, yy, windowSim, numbBits=16):
+    xMin, xMax, yMin, yMax = windowSim;
+    numbCells = 2 ** numbBits;  # number of cells along each side
+    # integer (grid) coordinates, clipped for points on the boundary
+    xxInt = np.clip(((xx - xMin) * (numbCells / (xMax - xMin))).astype(np.int64), 0, numbCells - 1);
+    yyInt = np.clip(((yy - yMin) * (numbCells / (yMax - yMin))).astype(np.int64), 0, numbCells - 1);
+    keyMorton = funSpreadBits(xxInt) | (funSpreadBits(yyInt) << np.uint64(1));
+    return keyMorton;
+#end function
+
+# sort a single realization along a Z-order curve
+def funMortonSort(xx, yy, windowSim, numbBits=16):
+    indexSort = np.argsort(funMortonKeys(xx, yy, windowSim, numbBits), kind='stable');
+    return xx[indexSort], yy[indexSort];
+#end function
+
+# sort the points of each ensemble along a Z-order curve
+# INPUT:
+# ppEnsemble is a PoissonEnsemble with (at least) x/y coordinates.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular simulation window.
+# numbBits is the number of bits for each coordinate (at most 32).
+# OUTPUT:
+# ppEnsembleSorted is a PoissonEnsemble with the points sorted in each ensemble.
+# indexSort is the permutation of the points (eg for sorting point marks).
+def funEnsembleMortonSort(ppEnsemble, windowSim, numbBits=16, booleIndex=False):
+    keyMorton = funMortonKeys(ppEnsemble.xx, ppEnsemble.yy, windowSim, numbBits);
+    indexSim = ppEnsemble.getIndexSim();
+
+    if ppEnsemble.numbSim < 2 ** (64 - 2 * numbBits):
+        # combine ensemble indices and keys into a single (64 bit) key
+        keyAll = (indexSim.astype(np.uint64) << np.uint64(2 * numbBits)) | keyMorton;
+        indexSort = np.argsort(keyAll, kind='stable');
+    else:
+        indexSort = np.lexsort((keyMorton, indexSim));
+    #end if-statement
+
+    ppEnsembleSorted = PoissonEnsemble(ppEnsemble.numbPoints,
+                                       *(coord[indexSort] for coord in ppEnsemble.coordAll),
+                                       indexPoints=ppEnsemble.indexPoints);
+    if booleIndex:
+        return ppEnsembleSorted, indexSort;
+    #end if-statement
+    return ppEnsembleSorted;
+#end function
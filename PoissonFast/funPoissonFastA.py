@@ -0,0 +1,68 @@
+# This code simulates many ensembles (or realizations) of a homogeneous
+# Poisson point process on a rectangle using Method A in PoissonFast.py,
+# meaning all the Poisson variables and then all the points are generated
+# in one step each. The ensembles are returned as a PoissonEnsemble.
+#
+# The numbers of points, the x coordinates and the y coordinates are each
+# generated with their own random number stream, which are spawned from
+# a single seed. Each stream is used sequentially, so simulating the
+# ensembles in batches (see funPoissonFastChunks.py) gives exactly the same
+# points as simulating them all at once.
+#
+# INPUT:
+# numbSim is the number of simulations (ie ensembles).
+# lambda0 is the intensity of the Poisson point process.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular simulation window.
+# seedRand is the random seed (None to use a seed from the computer).
+# dtypeCoord is the data type of the coordinates, where np.float32 (single
+# precision) halves the memory used and is generated directly (without
+# first generating np.float64 values).
+# OUTPUT:
+# ppEnsemble is a PoissonEnsemble with the x/y coordinates of all ensembles.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+
+# create random number streams for the numbers of points and x/y coordinates
+def funStreamsRand(seedRand=None):
+    if isinstance(seedRand, np.random.SeedSequence):
+        seedSeq = seedRand;
+    else:
+        seedSeq = np.random.SeedSequence(seedRand);
+    #end if-statement
+    seedN, seedX, seedY = seedSeq.spawn(3);
+    return np.random.default_rng(seedN), np.random.default_rng(seedX), np.random.default_rng(seedY);
+#end function
+
+# position points uniformly on the rectangle windowSim
+def funPointsRectangle(numbPointsTotal, windowSim, rngX, rngY, dtypeCoord=np.float64):
+    xMin, xMax, yMin, yMax = windowSim;
+    xDelta = xMax - xMin;
+    yDelta = yMax - yMin;  # rectangle dimensions
+    # uniform variables of type dtypeCoord, which are then rescaled in-place
+    # (so no temporary or np.float64 arrays are created)
+    xx = rngX.random(numbPointsTotal, dtype=dtypeCoord);
+    xx *= xDelta;
+    xx += xMin;  # x coordinates of Poisson points
+    yy = rngY.random(numbPointsTotal, dtype=dtypeCoord);
+    yy *= yDelta;
+    yy += yMin;  # y coordinates of Poisson points
+    return xx, yy;
+#end function
+
+def funPoissonFastA(numbSim, lambda0, windowSim, seedRand=None, dtypeCoord=np.float64):
+    xMin, xMax, yMin, yMax = windowSim;
+    areaTotal = (xMax - xMin) * (yMax - yMin);  # area of rectangle
+    massTotal = areaTotal * lambda0;  # total measure/mass of the point process
+
+    rngN, rngX, rngY = funStreamsRand(seedRand);
+    numbPoints = rngN.poisson(massTotal, numbSim);  # Poisson number of points
+    numbPointsTotal = np.sum(numbPoints);
+    xx, yy = funPointsRectangle(numbPointsTotal, windowSim, rngX, rngY, dtypeCoord);
+
+    return PoissonEnsemble(numbPoints, xx, yy);
+#end function
@@ -0,0 +1,71 @@
+# This code simulates many ensembles (or realizations) of a homogeneous
+# Poisson point process on a rectangle in batches (or chunks), so the
+# memory used is bounded, even when all the points of all the ensembles
+# would not fit in memory.
+#
+# The function is a generator, which yields a PoissonEnsemble for each
+# batch of consecutive ensembles. Each batch is simulated with Method A in
+# PoissonFast.py (ie vectorized), and holds at most about numbBytesMax
+# bytes of coordinates (unless a single ensemble is larger).
+#
+# For a fixed seed, the ensembles are the same for any value of
+# numbBytesMax and are the same as those from funPoissonFastA.
+#
+# EXAMPLE:
+# for ppEnsemble in funPoissonFastChunks(10**7,lambda0,windowSim,2**28,seedRand):
+#     distMin=funEnsembleMin(np.hypot(ppEnsemble.xx,ppEnsemble.yy),ppEnsemble.numbPoints);
+#
+# INPUT:
+# numbSim is the number of simulations (ie ensembles).
+# lambda0 is the intensity of the Poisson point process.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular simulation window.
+# numbBytesMax is the (approximate) memory budget of each batch in bytes.
+# seedRand is the random seed (None to use a seed from the computer).
+# dtypeCoord is the data type of the coordinates (eg np.float32).
+# OUTPUT:
+# ppEnsemble is a PoissonEnsemble for each batch of ensembles.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+from funPoissonFastA import funStreamsRand, funPointsRectangle # type: ignore
+
+def funPoissonFastChunks(numbSim, lambda0, windowSim, numbBytesMax=2**28, seedRand=None,
+                         dtypeCoord=np.float64):
+    xMin, xMax, yMin, yMax = windowSim;
+    areaTotal = (xMax - xMin) * (yMax - yMin);  # area of rectangle
+    massTotal = areaTotal * lambda0;  # total measure/mass of the point process
+
+    # maximum number of points in a batch (two coordinates per point)
+    numbBytesPoint = 2 * np.dtype(dtypeCoord).itemsize;
+    numbPointsMax = max(1, int(numbBytesMax // numbBytesPoint));
+    # number of Poisson variables generated at a time
+    numbSimBlockMax = max(1, int(numbPointsMax // max(massTotal, 1)));
+
+    rngN, rngX, rngY = funStreamsRand(seedRand);
+
+    ssDone = 0;  # number of ensembles simulated so far
+    while ssDone < numbSim:
+        numbSimBlock = min(numbSimBlockMax, numbSim - ssDone);
+        numbPoints = rngN.poisson(massTotal, numbSimBlock);  # Poisson number of points
+        indexCum = np.cumsum(numbPoints);
+
+        # split block into batches that fit in the memory budget
+        iStart = 0;
+        while iStart < numbSimBlock:
+            indexBase = indexCum[iStart - 1] if iStart > 0 else 0;
+            iEnd = int(np.searchsorted(indexCum, indexBase + numbPointsMax, side='right'));
+            iEnd = max(iEnd, iStart + 1);  # always at least one ensemble
+
+            numbPointsTotal = indexCum[iEnd - 1] - indexBase;
+            xx, yy = funPointsRectangle(numbPointsTotal, windowSim, rngX, rngY, dtypeCoord);
+            yield PoissonEnsemble(numbPoints[iStart:iEnd], xx, yy);
+
+            iStart = iEnd;
+        #end while-loop
+        ssDone = ssDone + numbSimBlock;
+    #end while-loop
+#end function
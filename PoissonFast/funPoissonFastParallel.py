@@ -0,0 +1,160 @@
+# This code simulates many ensembles (or realizations) of a homogeneous
+# Poisson point process on a rectangle by using several processes (ie CPU
+# cores) at the same time.
+#
+# The numbSim ensembles are divided into blocks of (at most) numbSimBlock
+# consecutive ensembles. Each block is given its own random seed, which is
+# spawned from the single seed seedRand, and is simulated with Method A in
+# PoissonFast.py (see funPoissonFastA.py).
+#
+# The Poisson numbers of points of all blocks are generated first (by the
+# main process), which gives the total number of points and where the points
+# of each block start. The coordinate arrays are then created once in
+# memory shared by all processes (or, if pathStore is given, as the
+# coordinate files of a store, see EnsembleStore.py), and each process
+# writes the x/y coordinates of its block directly into its part of these
+# arrays. Only the block number is passed back, so the coordinates are
+# never sent between processes or gathered with np.concatenate.
+#
+# The results depend only on seedRand and numbSimBlock, so they are the
+# same for any number of processes.
+#
+# NOTE: On systems that start new processes by spawning (eg Windows and
+# macOS), call this function under an if __name__ == '__main__': statement.
+#
+# INPUT:
+# numbSim is the number of simulations (ie ensembles).
+# lambda0 is the intensity of the Poisson point process.
+# windowSim=[xMin,xMax,yMin,yMax] is the rectangular simulation window.
+# numbProcess is the number of processes (None to use all CPU cores).
+# seedRand is the random seed (None to use a seed from the computer).
+# numbSimBlock is the number of ensembles in each block.
+# dtypeCoord is the data type of the coordinates (eg np.float32).
+# pathStore is the folder of a store for the ensembles (None to keep them in
+# memory), which are then returned backed by np.memmap.
+# OUTPUT:
+# ppEnsemble is a PoissonEnsemble with the x/y coordinates of all ensembles.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import os  # for file paths
+from concurrent.futures import ProcessPoolExecutor  # for a pool of processes
+from multiprocessing import shared_memory  # for arrays shared by processes
+from PoissonEnsemble import PoissonEnsemble # type: ignore
+from funPoissonFastA import funStreamsRand # type: ignore
+from EnsembleStore import funEnsembleCreate, funEnsembleMetaWrite, funEnsembleLoad # type: ignore
+
+# open the shared coordinate arrays (in shared memory or in files of a store)
+def funCoordOpen(nameCoordAll, pathStore, numbPointsTotal, dtypeCoord):
+    if pathStore is None:
+        sharedAll = [shared_memory.SharedMemory(name=nameCoord) for nameCoord in nameCoordAll];
+        coordAll = [np.ndarray((numbPointsTotal,), dtype=dtypeCoord, buffer=sharedTemp.buf)
+                    for sharedTemp in sharedAll];
+    else:
+        sharedAll = [];
+        coordAll = [np.memmap(os.path.join(pathStore, nameCoord), dtype=dtypeCoord, mode='r+',
+                              shape=(numbPointsTotal,)) for nameCoord in nameCoordAll];
+    #end if-statement
+    return sharedAll, coordAll;
+#end function
+
+# simulate the points of a single block of ensembles (run by each process),
+# writing them directly into the shared coordinate arrays
+def funPoissonFastBlock(argsBlock):
+    (numbPointsBlock, indexStart, windowSim, rngX, rngY, dtypeCoord,
+     nameCoordAll, pathStore, numbPointsTotal) = argsBlock;
+    xMin, xMax, yMin, yMax = windowSim;
+    sharedAll, (xxAll, yyAll) = funCoordOpen(nameCoordAll, pathStore, numbPointsTotal, dtypeCoord);
+
+    xx = xxAll[indexStart:indexStart + numbPointsBlock];
+    yy = yyAll[indexStart:indexStart + numbPointsBlock];
+    # uniform variables written in-place, and then rescaled in-place
+    rngX.random(numbPointsBlock, dtype=dtypeCoord, out=xx);
+    xx *= (xMax - xMin);
+    xx += xMin;  # x coordinates of Poisson points
+    rngY.random(numbPointsBlock, dtype=dtypeCoord, out=yy);
+    yy *= (yMax - yMin);
+    yy += yMin;  # y coordinates of Poisson points
+
+    if pathStore is not None:
+        xxAll.flush();
+        yyAll.flush();
+    #end if-statement
+    del xx, yy, xxAll, yyAll;  # release the shared memory before closing it
+    for sharedTemp in sharedAll:
+        sharedTemp.close();
+    #end for-loop
+    return numbPointsBlock;
+#end function
+
+def funPoissonFastParallel(numbSim, lambda0, windowSim, numbProcess=None, seedRand=None,
+                           numbSimBlock=10**5, dtypeCoord=np.float64, pathStore=None):
+    xMin, xMax, yMin, yMax = windowSim;
+    massTotal = (xMax - xMin) * (yMax - yMin) * lambda0;  # total measure/mass of the point process
+    dtypeCoord = np.dtype(dtypeCoord);
+
+    # number of ensembles in each block (the last block can be smaller)
+    numbBlock = max(1, -(-numbSim // numbSimBlock));
+    numbSimAll = np.full(numbBlock, numbSimBlock);
+    numbSimAll[-1] = numbSim - numbSimBlock * (numbBlock - 1);
+
+    # independent random seeds (ie streams) for each block
+    seedBlockAll = np.random.SeedSequence(seedRand).spawn(numbBlock);
+
+    # random number streams of each block (same as funPoissonFastA), where the
+    # streams for the x/y coordinates are passed to the processes
+    rngBlockAll = [funStreamsRand(seedBlock) for seedBlock in seedBlockAll];
+    # Poisson numbers of points of all blocks
+    numbPoints = np.concatenate([rngBlockAll[bb][0].poisson(massTotal, numbSimAll[bb])
+                                 for bb in range(numbBlock)]);
+    indexBlock = np.concatenate(([0], np.cumsum(numbSimAll)));
+    indexPoints = np.zeros(numbSim + 1, dtype=np.int64);
+    np.cumsum(numbPoints, out=indexPoints[1:]);
+    numbPointsTotal = int(indexPoints[-1]);
+
+    # create the coordinate arrays once (filled in-place by the processes)
+    if pathStore is None:
+        numbBytes = max(1, numbPointsTotal * dtypeCoord.itemsize);
+        sharedAll = [shared_memory.SharedMemory(create=True, size=numbBytes) for dd in range(2)];
+        nameCoordAll = [sharedTemp.name for sharedTemp in sharedAll];
+    else:
+        funEnsembleCreate(pathStore, numbPoints, 2, dtypeCoord);
+        nameCoordAll = ['coord0.bin', 'coord1.bin'];
+    #end if-statement
+
+    try:
+        if numbPointsTotal > 0:
+            argsBlockAll = [(int(indexPoints[indexBlock[bb + 1]] - indexPoints[indexBlock[bb]]),
+                             int(indexPoints[indexBlock[bb]]), windowSim, *rngBlockAll[bb][1:], dtypeCoord,
+                             nameCoordAll, pathStore, numbPointsTotal) for bb in range(numbBlock)];
+            # simulate blocks in parallel (only the numbers of points are returned)
+            with ProcessPoolExecutor(max_workers=numbProcess) as executor:
+                list(executor.map(funPoissonFastBlock, argsBlockAll));
+            #end with-statement
+        #end if-statement
+
+        if pathStore is None:
+            # copy out of the shared memory, which is then freed
+            xx, yy = (np.ndarray((numbPointsTotal,), dtype=dtypeCoord, buffer=sharedTemp.buf).copy()
+                      for sharedTemp in sharedAll);
+        #end if-statement
+    finally:
+        if pathStore is None:
+            for sharedTemp in sharedAll:
+                sharedTemp.close();
+                sharedTemp.unlink();
+            #end for-loop
+        #end if-statement
+    #end try-statement
+
+    if pathStore is not None:
+        funEnsembleMetaWrite(pathStore, dtypeCoord, 2, numbSim, numbPointsTotal,
+                             {'windowSim': windowSim, 'lambda0': lambda0, 'seedRand': seedRand,
+                              'numbSimBlock': numbSimBlock});
+        return funEnsembleLoad(pathStore);
+    #end if-statement
+    return PoissonEnsemble(numbPoints, xx, yy, indexPoints=indexPoints);
+#end function
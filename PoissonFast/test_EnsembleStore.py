@@ -0,0 +1,51 @@
+# Tests for EnsembleStore.py (run with pytest).
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import os, sys  # for finding the code in this folder
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)));
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import pytest
+from EnsembleStore import EnsembleWriter, funEnsembleCreate, funEnsembleLoad # type: ignore
+
+def test_store_round_trip(tmp_path):
+    pathStore = str(tmp_path / 'store');
+    numbPoints = np.array([2, 0, 3]);
+    xx = np.arange(5.0);
+    yy = -np.arange(5.0);
+    with EnsembleWriter(pathStore) as writer:
+        writer.append(numbPoints, xx, yy);
+    #end with-statement
+    ppEnsemble = funEnsembleLoad(pathStore);
+    assert ppEnsemble.numbSim == 3;
+    assert np.array_equal(ppEnsemble[2][1], yy[2:]);
+
+def test_store_error_leaves_no_metadata(tmp_path):
+    pathStore = str(tmp_path / 'store');
+    # a complete store in the same folder (from an earlier run)
+    with EnsembleWriter(pathStore, {'lambda0': 10}) as writer:
+        writer.append(np.array([3, 1, 2]), np.zeros(6), np.ones(6));
+    #end with-statement
+    assert funEnsembleLoad(pathStore).numbSim == 3;
+
+    with pytest.raises(RuntimeError):
+        with EnsembleWriter(pathStore) as writer:
+            writer.append(np.array([1, 1]), np.zeros(2), np.ones(2));
+            raise RuntimeError('simulation failed');
+        #end with-statement
+    #end with-statement
+    assert not os.path.exists(os.path.join(pathStore, 'metadata.json'));
+    assert writer.fileNumb.closed and all(fileTemp.closed for fileTemp in writer.fileCoordAll);
+    with pytest.raises(FileNotFoundError):
+        funEnsembleLoad(pathStore);
+
+def test_store_create_removes_metadata(tmp_path):
+    pathStore = str(tmp_path / 'store');
+    with EnsembleWriter(pathStore) as writer:
+        writer.append(np.array([1, 1]), np.zeros(2), np.ones(2));
+    #end with-statement
+    funEnsembleCreate(pathStore, np.array([2, 2]), 2);
+    with pytest.raises(FileNotFoundError):
+        funEnsembleLoad(pathStore);
@@ -0,0 +1,135 @@
+# This code defines an accumulator for performing a chi-squared test to see
+# whether samples (of non-negative integers) come from a Poisson
+# distribution, as done in PoissonTest.py, but without storing the samples.
+#
+# The samples are given in chunks (ie arrays) to the method update, which
+# only keeps the number of times each integer value has appeared (found
+# with np.bincount), so the support grows as larger values appear. The
+# memory used then depends on the largest value, not the number of samples.
+#
+# The sample mean, sample variance and the chi-squared test (with the
+# expected counts from a Poisson distribution with the sample mean) are
+# calculated from these counts when needed.
+#
+# For the chi-squared test, the expected probabilities of the two end values
+# include the tails of the Poisson distribution (so they sum to one), and
+# neighbouring values are then merged (see funPoolBins) until each expected
+# count is at least countMin (five by default), as the chi-squared
+# approximation is poor for small expected counts. Without merging, the many
+# sparse tail values of large samples (eg mu=10^5) would reject even samples
+# from np.random.poisson. The function funChiSquaredPoisson performs this
+# test on any counts (eg from funPoissonEmpPMF.py in PoissonTest.py). If too
+# few bins remain after merging (eg for very small mu), there are no degrees
+# of freedom, so a warning is given and the statistic and p-value are nan.
+#
+# EXAMPLE:
+# testChiSquared=PoissonChiSquared();
+# for cc in range(numbChunk):
+#     testChiSquared.update(funPoissonLargePTRSBatch(mu,numbSimChunk));
+# statChiSquare,pValue=testChiSquared.getTest();
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import scipy
+import warnings  # for warning when there is no test
+
+# merge neighbouring bins (in order) until each expected count is at least
+# countMin, where leftover bins at the end are merged with the last bin
+def funPoolBins(countsObserved, countsExpected, countMin=5):
+    indexPool = np.zeros(countsExpected.size, dtype=np.int64); # pooled bin of each bin
+    numbPool = 0;
+    countPool = 0;
+    for ii in range(countsExpected.size):
+        indexPool[ii] = numbPool;
+        countPool = countPool + countsExpected[ii];
+        if (countPool >= countMin):
+            numbPool = numbPool + 1;
+            countPool = 0;
+        #end if-statement
+    #end for-loop
+    if (countPool > 0) and (numbPool > 0):
+        indexPool[indexPool == numbPool] = numbPool - 1; # merge leftover bins
+    #end if-statement
+    numbPool = indexPool[-1] + 1;
+    countsObservedPool = np.bincount(indexPool, weights=countsObserved, minlength=numbPool);
+    countsExpectedPool = np.bincount(indexPool, weights=countsExpected, minlength=numbPool);
+    return countsObservedPool, countsExpectedPool;
+#end function
+
+# chi-squared test with Poisson distribution with mean of the samples, where
+# countsObserved are the counts of the consecutive values binsX
+def funChiSquaredPoisson(binsX, countsObserved, ddof=1, countMin=5):
+    numbSim = np.sum(countsObserved);
+    meanX = np.sum(binsX * countsObserved) / numbSim; #use sample mean
+    probExpected = scipy.stats.poisson.pmf(binsX, meanX);
+    #include the tails in the end values
+    probExpected[0] = scipy.stats.poisson.cdf(binsX[0], meanX);
+    probExpected[-1] = probExpected[-1] + scipy.stats.poisson.sf(binsX[-1], meanX);
+    countsExpected = probExpected * numbSim;
+
+    countsObserved, countsExpected = funPoolBins(countsObserved, countsExpected, countMin);
+    if (countsExpected.size - 1 - ddof < 1):
+        #no degrees of freedom left (eg very small mu), so no test
+        warnings.warn('Too few bins (after merging) for a chi-squared test.');
+        return np.nan, np.nan;
+    #end if-statement
+    resultsChiSquare = scipy.stats.chisquare(f_obs=countsObserved, f_exp=countsExpected, ddof=ddof);
+    return resultsChiSquare.statistic, resultsChiSquare.pvalue;
+#end function
+
+class PoissonChiSquared:
+    def __init__(self):
+        self.countsObserved = np.zeros(0, dtype=np.int64); # counts of values 0,1,2,...
+        self.numbSim = 0; # total number of samples
+    #end function
+
+    # add a chunk of samples
+    def update(self, X):
+        X = np.asarray(X).ravel();
+        if (X.size == 0):
+            return;
+        #end if-statement
+        X = X.astype(np.int64);
+        if (np.min(X) < 0):
+            raise ValueError('Samples must be non-negative integers.');
+        #end if-statement
+
+        countsChunk = np.bincount(X);
+        numbValues = max(countsChunk.size, self.countsObserved.size);
+        if (numbValues > self.countsObserved.size):
+            # grow support (ie new larger values)
+            self.countsObserved = np.pad(self.countsObserved, (0, numbValues - self.countsObserved.size));
+        #end if-statement
+        self.countsObserved[:countsChunk.size] += countsChunk;
+        self.numbSim = self.numbSim + X.size;
+    #end function
+
+    # values that have appeared (ie from minimum to maximum) and their counts
+    def getCounts(self):
+        indexNonZero = np.flatnonzero(self.countsObserved);
+        if (indexNonZero.size == 0):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64);
+        #end if-statement
+        binsX = np.arange(indexNonZero[0], indexNonZero[-1] + 1);
+        return binsX, self.countsObserved[binsX];
+    #end function
+
+    def getMean(self):
+        binsX, countsObserved = self.getCounts();
+        return np.sum(binsX * countsObserved) / self.numbSim;
+
+    def getVar(self):
+        binsX, countsObserved = self.getCounts();
+        meanX = np.sum(binsX * countsObserved) / self.numbSim;
+        return np.sum((binsX - meanX) ** 2 * countsObserved) / self.numbSim;
+
+    # chi-squared test with Poisson distribution with mean of the samples
+    def getTest(self, ddof=1, countMin=5):
+        binsX, countsObserved = self.getCounts();
+        return funChiSquaredPoisson(binsX, countsObserved, ddof, countMin);
+    #end function
+
+#end class
@@ -0,0 +1,78 @@
+# This code defines a reusable sampler object for generating Poisson
+# variates with large Poisson parameter values (mu) using Algorithm PTRS or
+# Algorithm PA (see funPoissonLargePTRS.py and funPoissonLargePA.py).
+#
+# The constants of each algorithm depend only on mu, so the sampler keeps
+# them in a least recently used (LRU) cache with at most numbCacheMax
+# values of mu. When the same few mu values are used repeatedly, the
+# constants are then only calculated once for each mu.
+#
+# EXAMPLE:
+# samplerPoisson=PoissonLargeSampler('PTRS');
+# n=samplerPoisson.sample(30); #single variate
+# X=samplerPoisson.sampleBatch(30,10**6); #array of variates
+# X=samplerPoisson.sampleBatch(muArray); #one variate for each mu in muArray
+#
+# INPUT:
+# choiceMethod is the generating method, 'PTRS' or 'PA'.
+# numbCacheMax is the maximum number of mu values with cached constants.
+# rng is a random number generator (None to use np.random).
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from functools import lru_cache  # for caching constants
+from funPoissonLargePTRS import funConstPTRS # type: ignore
+from funPoissonLargePA import funConstPA # type: ignore
+from funPoissonLargePTRSBatch import funPoissonLargePTRSBatch # type: ignore
+from funPoissonLargePABatch import funPoissonLargePABatch # type: ignore
+
+class PoissonLargeSampler:
+    def __init__(self, choiceMethod='PTRS', numbCacheMax=128, rng=None):
+        if choiceMethod == 'PTRS':
+            funConst = funConstPTRS;
+            self.funBatch = funPoissonLargePTRSBatch;
+        elif choiceMethod == 'PA':
+            funConst = funConstPA;
+            self.funBatch = funPoissonLargePABatch;
+        else:
+            raise ValueError('Method must be PTRS or PA.');
+        #end if-statement
+        self.choiceMethod = choiceMethod;
+        self.rng = np.random if rng is None else rng;
+        # constants for each mu (each sampler has its own bounded cache)
+        self.getConst = lru_cache(maxsize=numbCacheMax)(funConst);
+    #end function
+
+    # constants for an array of mu values, using the cache for each
+    # distinct value of mu
+    def getConstArray(self, mu):
+        muUnique, indexInverse = np.unique(mu, return_inverse=True);
+        constUnique = np.array([self.getConst(float(muTemp)) for muTemp in muUnique]);
+        return tuple(constUnique[indexInverse, ii] for ii in range(constUnique.shape[1]));
+    #end function
+
+    # generate numbSim variates for mu (a single value or an array), where
+    # statsRNG is an optional dictionary of counters (see funStatsRejection.py)
+    def sampleBatch(self, mu, numbSim=None, statsRNG=None):
+        if np.ndim(mu) == 0:
+            constMu = self.getConst(float(mu));
+        else:
+            mu = np.asarray(mu, dtype=float).ravel();
+            constMu = self.getConstArray(mu);
+        #end if-statement
+        return self.funBatch(mu, numbSim, self.rng, constMu, statsRNG);
+    #end function
+
+    # generate a single variate for a single mu
+    def sample(self, mu, statsRNG=None):
+        return self.sampleBatch(mu, 1, statsRNG)[0];
+    #end function
+
+    # information on the cache (hits, misses, maximum size and current size)
+    def getCacheInfo(self):
+        return self.getConst.cache_info();
+
+#end class
@@ -8,10 +8,13 @@
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # for plotting
-import scipy 
 from funPlotPoissonEmpPDF import funPlotPoissonEmpPDF # type: ignore
+from funPoissonEmpPMF import funPoissonEmpPMF # type: ignore
 from funPoissonLargePA import funPoissonLargePA # type: ignore
 from funPoissonLargePTRS import funPoissonLargePTRS # type: ignore
+from funPoissonLargePTRSBatch import funPoissonLargePTRSBatch # type: ignore
+from funPoissonLargePABatch import funPoissonLargePABatch # type: ignore
+from PoissonChiSquared import PoissonChiSquared, funChiSquaredPoisson # type: ignore
 
 plt.close("all");  # close all previous plots
 
@@ -19,38 +22,57 @@ mu=30; #Poisson parameter (ie its mean)
 boolePlotResults= True;
 
 numbSim=10**6; #number of samples/simulations
+booleBatch= True; #use vectorized (batch) function instead of a for-loop
+choiceMethod='PTRS'; #Poisson generating method: 'PTRS' or 'PA'
+booleStream= False; #test samples in chunks without storing them (needs booleBatch)
+numbSimChunk=10**6; #number of samples in each chunk
 
-#sample using given Poisson function
-X=np.zeros((numbSim,1));
-for ss in range(numbSim):
-    X[ss]=funPoissonLargePTRS(mu);
-#end for-loop
-Y=np.random.poisson(mu, numbSim); #sample using built-in Poisson function
+funPoissonBatch=funPoissonLargePABatch if (choiceMethod=='PA') else funPoissonLargePTRSBatch;
 
-#plot results
-if boolePlotResults:
-    funPlotPoissonEmpPDF(X); 
-#end if-statement
+if booleStream:
+    #sample and count values in chunks (so numbSim can be very large)
+    testChiSquared=PoissonChiSquared();
+    numbSimDone=0;
+    while (numbSimDone<numbSim):
+        numbSimTemp=min(numbSimChunk,numbSim-numbSimDone);
+        testChiSquared.update(funPoissonBatch(mu,numbSimTemp));
+        numbSimDone=numbSimDone+numbSimTemp;
+    #end while-loop
+
+    meanX=testChiSquared.getMean(); #mean
+    varX=testChiSquared.getVar(); #variance
+    _,pValueChiSquare=testChiSquared.getTest(ddof=1); #perform chi-squared test
+else:
+    #sample using given Poisson function
+    if booleBatch:
+        X=funPoissonBatch(mu,numbSim);
+    else:
+        funPoissonLarge=funPoissonLargePA if (choiceMethod=='PA') else funPoissonLargePTRS;
+        X=np.zeros((numbSim,1));
+        for ss in range(numbSim):
+            X[ss]=funPoissonLarge(mu);
+        #end for-loop
+    #end if-statement
+    Y=np.random.poisson(mu, numbSim); #sample using built-in Poisson function
+
+    #plot results
+    if boolePlotResults:
+        funPlotPoissonEmpPDF(X); 
+    #end if-statement
 
-meanX=np.mean(X); #unbiased mean
-varX=np.var(X); #unbiased variance
+    # empirical probability mass function (using a bincount), mean, variance and counts
+    binsX, pmfX, meanX, varX, countsObserved = funPoissonEmpPMF(X);
+
+    #perform chi-squared test (with sparse tail values merged)
+    _,pValueChiSquare=funChiSquaredPoisson(binsX,countsObserved,ddof=1);
+#end if-statement
 ratioMeanVarX=meanX/varX; #a Poisson distribution implies value of one
 
 print("The mean of X is " + str(meanX) +".");
 print("The variance of X is " + str(varX) +".");
 
-# do histogram to get empirical probability mass function
-binsX=np.arange(np.min(X),np.max(X)+1);
-numbBinsX=binsX.size;
-countsObserved,_=np.histogram(X,numbBinsX, density=False);
-countsExpected=scipy.stats.poisson.pmf(binsX,meanX); #use sample mean
-#rescale so countsExpected and countsObserved have the same total sum
-countsExpected=countsExpected/np.sum(countsExpected)*np.sum(countsObserved); 
-
-#perform chi-squared test
-resultsChiSquare=scipy.stats.chisquare(f_obs=countsObserved,f_exp=countsExpected,ddof =1);
 pValueTest=0.05;
-booleChiSquaredTest= (resultsChiSquare.pvalue<pValueTest);
+booleChiSquaredTest= (pValueChiSquare<pValueTest);
 
 print("The null hypothesis is that the data came from a Poisson distribution with mean of X.");
 if booleChiSquaredTest:
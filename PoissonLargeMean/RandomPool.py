@@ -0,0 +1,127 @@
+# This code defines a pool (or buffer) of random numbers for functions that
+# use only one or two random numbers at a time, such as the scalar Poisson
+# generating functions funPoissonLargePTRS, funPoissonLargePA and
+# funPoissonLoop (in the folder PoissonDirect), or a Fisher-Yates shuffle
+# (funRandPermute in the folder NewmanZiff).
+#
+# Calling NumPy for a single random number takes much longer than the
+# random number itself, so the pool generates large blocks (of numbBlock
+# values) of uniform, normal and exponential variables, and then hands them
+# out one at a time (or in small arrays). A block is only generated again
+# when all its values have been used.
+#
+# Each kind of random variable has its own random number stream, which are
+# spawned from a single seed, and each stream is used sequentially. The
+# values given by the pool are then the same as drawing them directly from
+# the streams (one at a time), however the values are requested, so the
+# results are reproducible with the seed.
+#
+# EXAMPLE:
+# poolRand=RandomPool(seedRand=1);
+# U=poolRand.uniform(); #single uniform variable
+# E=poolRand.exponential(10); #array of 10 exponential variables
+# n=funPoissonLargePTRS(30,pool=poolRand);
+#
+# INPUT:
+# seedRand is the random seed (None to use a seed from the computer).
+# numbBlock is the number of random variables generated in each block.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+
+class RandomPool:
+    def __init__(self, seedRand=None, numbBlock=2 ** 16):
+        if isinstance(seedRand, np.random.SeedSequence):
+            seedSeq = seedRand;
+        else:
+            seedSeq = np.random.SeedSequence(seedRand);
+        #end if-statement
+        self.numbBlock = numbBlock;
+        # a random number stream for each kind of random variable
+        seedU, seedN, seedE = seedSeq.spawn(3);
+        self.dictRNG = {'uniform': np.random.default_rng(seedU),
+                        'normal': np.random.default_rng(seedN),
+                        'exponential': np.random.default_rng(seedE)};
+        # blocks of random variables (as arrays and lists) and the number used
+        # (blocks are first generated when needed)
+        self.dictArray = {kindRand: np.zeros(0) for kindRand in self.dictRNG};
+        self.dictList = {kindRand: [] for kindRand in self.dictRNG};
+        self.dictIndex = {kindRand: numbBlock for kindRand in self.dictRNG};
+    #end function
+
+    # generate a new block of random variables of kind kindRand
+    def refill(self, kindRand):
+        rngTemp = self.dictRNG[kindRand];
+        if kindRand == 'uniform':
+            arrayRand = rngTemp.random(self.numbBlock);
+        elif kindRand == 'normal':
+            arrayRand = rngTemp.standard_normal(self.numbBlock);
+        else:
+            arrayRand = rngTemp.standard_exponential(self.numbBlock);
+        #end if-statement
+        self.dictArray[kindRand] = arrayRand;
+        self.dictList[kindRand] = arrayRand.tolist(); #Python floats are faster to hand out
+        self.dictIndex[kindRand] = 0;
+    #end function
+
+    # single random variable (as a Python float)
+    def getScalar(self, kindRand):
+        indexRand = self.dictIndex[kindRand];
+        if indexRand >= self.numbBlock:
+            self.refill(kindRand);
+            indexRand = 0;
+        #end if-statement
+        self.dictIndex[kindRand] = indexRand + 1;
+        return self.dictList[kindRand][indexRand];
+    #end function
+
+    # array of numbRand random variables (continuing across blocks if needed)
+    def getArray(self, kindRand, numbRand):
+        arrayRand = np.empty(numbRand);
+        numbDone = 0;
+        while (numbDone < numbRand):
+            if self.dictIndex[kindRand] >= self.numbBlock:
+                self.refill(kindRand);
+            #end if-statement
+            indexRand = self.dictIndex[kindRand];
+            numbTemp = min(numbRand - numbDone, self.numbBlock - indexRand);
+            arrayRand[numbDone:numbDone + numbTemp] = self.dictArray[kindRand][indexRand:indexRand + numbTemp];
+            self.dictIndex[kindRand] = indexRand + numbTemp;
+            numbDone = numbDone + numbTemp;
+        #end while-loop
+        return arrayRand;
+    #end function
+
+    # uniform variables on [0,1) (a single value if numbRand is None)
+    def uniform(self, numbRand=None):
+        if numbRand is None:
+            return self.getScalar('uniform');
+        #end if-statement
+        return self.getArray('uniform', numbRand);
+    #end function
+
+    # standard normal variables (a single value if numbRand is None)
+    def normal(self, numbRand=None):
+        if numbRand is None:
+            return self.getScalar('normal');
+        #end if-statement
+        return self.getArray('normal', numbRand);
+    #end function
+
+    # exponential variables with mean one (a single value if numbRand is None)
+    def exponential(self, numbRand=None):
+        if numbRand is None:
+            return self.getScalar('exponential');
+        #end if-statement
+        return self.getArray('exponential', numbRand);
+    #end function
+
+    # single random integer j such that low<=j<high (from one uniform variable)
+    def integers(self, low, high):
+        return low + int(self.getScalar('uniform') * (high - low));
+    #end function
+
+#end class
@@ -3,21 +3,16 @@
 # Website: hpaulkeeler.com
 # Repository: github.com/hpaulkeeler/posts
 
-import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # for plotting
 import scipy 
+from funPoissonEmpPMF import funPoissonEmpPMF # type: ignore
 
 #helper function for plotting histogram of possibly Poisson data
 def funPlotPoissonEmpPDF(X):
-    meanEmp=np.mean(X); #(unbiased) empirical mean of X
-    varEmp=np.var(X); #(unbiased) empirical variance of X
+    #empirical probability mass function, mean and variance of X
+    #(using a bincount for integer data)
+    nValues, pmfEmp, meanEmp, varEmp, _ = funPoissonEmpPMF(X);
 
-    #do histogram to get empirical probability mass function
-    binEdges=np.arange(np.min(X),np.max(X+1))-0.5;
-    pmfEmp, _=np.histogram(X,bins=binEdges, density=True);
-
-
-    nValues=np.arange(np.min(X),np.max(X)); # histogram range
     #analytic solution of probability mass function
     pmfExact=scipy.stats.poisson.pmf(nValues,meanEmp);
 
@@ -0,0 +1,64 @@
+# This code finds the empirical probability mass function (PMF) of some
+# (possibly Poisson) data X, as well as the empirical mean and variance, and
+# the numbers of times each value appears.
+#
+# If the data are integers (of integer type, or floats with integer values),
+# then the number of times each value appears is found with np.bincount,
+# after offsetting the data by its minimum, which is much faster than doing
+# a histogram with bin edges for large amounts of data. Otherwise (or if the
+# range of values is much larger than the number of data), the counts are
+# found with np.unique.
+#
+# The mean and variance are then calculated from the counts, so the data are
+# only passed over a few times, however large it is.
+#
+# For plotting the empirical PMF, see funPlotPoissonEmpPDF.py.
+#
+# INPUT:
+# X is an array of data (eg Poisson variates or numbers of points).
+# OUTPUT:
+# nValues is an array of the values from the minimum to the maximum of X
+# (or the distinct values of X, if X are not integers).
+# pmfEmp is an array of the empirical probabilities of the values in nValues.
+# meanEmp is the empirical mean of X.
+# varEmp is the (biased) empirical variance of X.
+# countsX is an array of the (raw) numbers of times the values in nValues
+# appear in X, eg for a chi-squared test (see PoissonTest.py).
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+
+def funPoissonEmpPMF(X):
+    X = np.asarray(X).ravel();
+    numbData = X.size;
+    if (numbData == 0):
+        raise ValueError('Data X must not be empty.');
+    #end if-statement
+
+    xMin = np.min(X);
+    xMax = np.max(X);
+    #check for integer data (without a large bincount)
+    if np.issubdtype(X.dtype, np.integer):
+        booleInteger = True;
+    else:
+        booleInteger = np.all(np.isfinite([xMin, xMax])) and np.all(X == np.floor(X));
+    #end if-statement
+    booleInteger = booleInteger and (xMax - xMin < max(10 * numbData, 2 ** 20));
+
+    if booleInteger:
+        xMin = int(xMin);
+        countsX = np.bincount((X - xMin).astype(np.int64)); #offset bincount
+        nValues = np.arange(xMin, xMin + countsX.size);
+    else:
+        nValues, countsX = np.unique(X, return_counts=True);
+    #end if-statement
+
+    pmfEmp = countsX / numbData; #empirical probability mass function
+    meanEmp = np.sum(nValues * pmfEmp); #empirical mean
+    varEmp = np.sum((nValues - meanEmp) ** 2 * pmfEmp); #empirical variance
+
+    return nValues, pmfEmp, meanEmp, varEmp, countsX;
+#end function
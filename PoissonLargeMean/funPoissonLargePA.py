@@ -18,6 +18,10 @@
 #
 # INPUT:
 # mu is a single Poisson parameter (or mean) such that mu>=0.
+# statsRNG is a dictionary of counters from funStatsRejection (None for no
+# counting), which is updated with the work done (see funStatsRejection.py).
+# pool is a RandomPool for the uniform variables (None to use np.random),
+# which is faster when generating many variates (see RandomPool.py).
 # OUTPUT:
 # result_k is a single Poisson variate (that is, an instance of a Poisson random
 # variable), which is a non-negative integer.
@@ -27,31 +31,51 @@
 # Repository: github.com/hpaulkeeler/posts
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
-import scipy 
+from functools import lru_cache  # for caching constants
 from getLogFac import getLogFac # type: ignore
 
-def funPoissonLargePA(mu):
-    #precalculate some Poisson-parameter-dependent numbers
+#precalculate some Poisson-parameter-dependent numbers (mu can be an array)
+def funConstPA(mu):
     c = 0.767 - 3.36/mu;
     beta = np.pi/np.sqrt(3.0*mu);
     alpha = beta*mu;
     k = np.log(c) - mu - np.log(beta);
     log_mu=np.log(mu);
+    return c, beta, alpha, k, log_mu;
+
+#cached constants for a single mu, as the same mu is often used many times
+getConstPA = lru_cache(maxsize=128)(funConstPA);
+
+def funPoissonLargePA(mu, statsRNG=None, pool=None):
+    #precalculate (or retrieve) some Poisson-parameter-dependent numbers
+    c, beta, alpha, k, log_mu = getConstPA(float(mu));
 
     result_n=-1; #initialize the Poisson random variable (or variate)
     while (result_n<0):
-        U = np.random.uniform(0, 1, 1); #generate first uniform variable
+        #generate first uniform variable
+        U = np.random.uniform(0, 1, 1) if pool is None else pool.uniform();
         x = (alpha - np.log((1.0 - U)/U))/beta;
+        if statsRNG is not None:
+            statsRNG['numbIteration'] += 1;
+            statsRNG['numbCandidate'] += 1;
+            statsRNG['numbUniform'] += 1;
+        #end if-statement
 
         if (x <-.5):
+            if statsRNG is not None:
+                statsRNG['numbRejectQuick'] += 1;
+            #end if-statement
             continue
         else:
-            V = np.random.uniform(0, 1, 1); #generate second uniform variable
+            #generate second uniform variable
+            V = np.random.uniform(0, 1, 1) if pool is None else pool.uniform();
+            if statsRNG is not None:
+                statsRNG['numbUniform'] += 1;
+                statsRNG['numbTestFull'] += 1;
+            #end if-statement
             n = np.floor(x+.5);
             y = alpha - beta*x;
-            #logfac_n=getLogFac(n); 
-            #above can be replaced with scipy function: 
-            logfac_n=scipy.special.gammaln(n+1)
+            logfac_n = getLogFac(n);
 
             #two sides of an inequality condition
             lhs = y + np.log(V/(1.0 + np.exp(y))**2);
@@ -59,6 +83,10 @@ def funPoissonLargePA(mu):
 
             if (lhs <= rhs):
                 result_n=n;
+                if statsRNG is not None:
+                    statsRNG['numbAcceptFull'] += 1;
+                    statsRNG['numbSample'] += 1;
+                #end if-statement
                 return result_n;
             else:
                 continue;
@@ -0,0 +1,105 @@
+# This code generates many Poisson variates (or simulates many Poisson
+# variables) at once using a method designed for large (>30) Poisson
+# parameter values.
+#
+# The generation method is Algorithm PA, a type of rejection method, from 
+# the paper:
+#
+# 1979 - Atkinson - "The Computer Generation of Poisson Random Variables"
+#
+# This is a vectorized (or batch) version of funPoissonLargePA. The steps
+# of the rejection method are run on whole arrays (with the log factorials
+# found for all candidates in one call), and only the variates that were
+# rejected are generated again, until all variates are accepted.
+#
+# In practice, you should *always* use the built-in NumPy function
+# random.poisson, which (for large Poisson parameter) uses Algorithm PTRS in the
+# paper:
+#
+# 1993 - Hörmann - "The transformed rejection method for generating Poisson
+# random variables"
+#
+# INPUT:
+# mu is a single Poisson parameter (or mean) or an array of Poisson
+# parameters such that mu>=30.
+# numbSim is the number of variates (None to use the size of mu).
+# rng is a random number generator (None to use np.random).
+# constMu are the constants (from funConstPA) for mu (None to calculate them).
+# statsRNG is a dictionary of counters from funStatsRejection (None for no
+# counting), which is updated with the work done (see funStatsRejection.py).
+# OUTPUT:
+# result_n is an array of Poisson variates (that is, instances of Poisson
+# random variables), which are non-negative integers.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from getLogFac import getLogFac # type: ignore
+from funPoissonLargePA import funConstPA # type: ignore
+
+def funPoissonLargePABatch(mu, numbSim=None, rng=None, constMu=None, statsRNG=None):
+    if rng is None:
+        rng = np.random;
+    #end if-statement
+    mu = np.asarray(mu, dtype=float).ravel() if np.ndim(mu) > 0 else np.asarray(mu, dtype=float);
+    if numbSim is None:
+        numbSim = mu.size;
+    #end if-statement
+
+    #precalculate some Poisson-parameter-dependent numbers
+    if constMu is None:
+        constMu = funConstPA(mu);
+    #end if-statement
+    c, beta, alpha, k, log_mu = (np.broadcast_to(constTemp, (numbSim,)) for constTemp in constMu);
+
+    result_n = np.full(numbSim, -1, dtype=np.int64); #initialize the Poisson variates
+    indexPending = np.arange(numbSim); #variates not yet accepted
+    while (indexPending.size > 0):
+        alpha_p = alpha[indexPending];
+        beta_p = beta[indexPending];
+        numbPending = indexPending.size;
+
+        U = rng.uniform(0, 1, numbPending); #generate first uniform variables
+        x = (alpha_p - np.log((1.0 - U)/U))/beta_p;
+
+        #candidates with x<-0.5 are rejected (without a second uniform variable)
+        booleTest = (x >= -.5);
+        indexTest = np.flatnonzero(booleTest);
+        booleAccept = np.zeros(numbPending, dtype=bool);
+        if statsRNG is not None:
+            statsRNG['numbIteration'] += 1;
+            statsRNG['numbCandidate'] += numbPending;
+            statsRNG['numbUniform'] += numbPending + indexTest.size;
+            statsRNG['numbRejectQuick'] += numbPending - indexTest.size;
+            statsRNG['numbTestFull'] += indexTest.size;
+        #end if-statement
+
+        if (indexTest.size > 0):
+            V = rng.uniform(0, 1, indexTest.size); #generate second uniform variables
+            x_t = x[indexTest];
+            n_t = np.floor(x_t+.5);
+            y = alpha_p[indexTest] - beta_p[indexTest]*x_t;
+            #log factorial n (for all candidates at once)
+            logfac_n = getLogFac(n_t);
+
+            #two sides of an inequality condition, where
+            #log(V/(1+exp(y))**2)=log(V)-2*log(1+exp(y)) avoids overflow
+            lhs = y + np.log(V) - 2*np.logaddexp(0, y);
+            rhs = k[indexPending[indexTest]] + n_t*log_mu[indexPending[indexTest]] - logfac_n; # NOTE: uses log factorial n
+            booleAccept[indexTest] = (lhs <= rhs);
+            if statsRNG is not None:
+                statsRNG['numbAcceptFull'] += int(np.sum(lhs <= rhs));
+            #end if-statement
+        #end if-statement
+
+        result_n[indexPending[booleAccept]] = np.floor(x[booleAccept]+.5);
+        indexPending = indexPending[~booleAccept]; #re-generate rejected variates
+    #end while-loop
+    if statsRNG is not None:
+        statsRNG['numbSample'] += numbSim;
+    #end if-statement
+
+    return result_n;
+#end function
@@ -15,6 +15,10 @@
 #
 # INPUT:
 # mu is a single Poisson parameter (or mean) such that mu>=0.
+# statsRNG is a dictionary of counters from funStatsRejection (None for no
+# counting), which is updated with the work done (see funStatsRejection.py).
+# pool is a RandomPool for the uniform variables (None to use np.random),
+# which is faster when generating many variates (see RandomPool.py).
 # OUTPUT:
 # result_k is a single Poisson variate (that is, an instance of a Poisson random
 # variable), which is a non-negative integer.
@@ -24,22 +28,41 @@
 # Repository: github.com/hpaulkeeler/posts
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
-import scipy 
+from functools import lru_cache  # for caching constants
 from getLogFac import getLogFac # type: ignore
 
-def funPoissonLargePTRS(mu):
-    #precalculate some Poisson-parameter-dependent numbers
+#precalculate some Poisson-parameter-dependent numbers (mu can be an array)
+def funConstPTRS(mu):
     b = 0.931 + 2.53 * np.sqrt(mu);
     a =  -0.059 + 0.02483 * b;
     vr = 0.9277 - 3.6224 / (b - 2);
     one_over_alpha=1.1239 + 1.1328/(b - 3.4);
+    log_mu = np.log(mu);
+    return b, a, vr, one_over_alpha, log_mu;
+
+#cached constants for a single mu, as the same mu is often used many times
+getConstPTRS = lru_cache(maxsize=128)(funConstPTRS);
+
+def funPoissonLargePTRS(mu, statsRNG=None, pool=None):
+    #precalculate (or retrieve) some Poisson-parameter-dependent numbers
+    b, a, vr, one_over_alpha, log_mu = getConstPTRS(float(mu));
 
     result_n=-1; #initialize the Poisson random variable (or variate)
     #Steps 1 to 3.1 in Algorithm PTRS
     while (result_n<0):
         #generate two uniform variables
-        U = np.random.uniform(0, 1, 1); 
-        V = np.random.uniform(0, 1, 1); 
+        if pool is None:
+            U = np.random.uniform(0, 1, 1); 
+            V = np.random.uniform(0, 1, 1); 
+        else:
+            U = pool.uniform();
+            V = pool.uniform();
+        #end if-statement
+        if statsRNG is not None:
+            statsRNG['numbIteration'] += 1;
+            statsRNG['numbCandidate'] += 1;
+            statsRNG['numbUniform'] += 2;
+        #end if-statement
 
         U=U-0.5;
         us = 0.5 -  abs(U);
@@ -48,17 +71,25 @@ def funPoissonLargePTRS(mu):
 
         if (us>=0.07)&(V<=vr):
             result_n = n;
+            if statsRNG is not None:
+                statsRNG['numbAcceptSqueeze'] += 1;
+                statsRNG['numbSample'] += 1;
+            #end if-statement
             return result_n;
         #end if-statement
 
         if (n<=0) |((us < 0.013) & ( V> us)):
+            if statsRNG is not None:
+                statsRNG['numbRejectQuick'] += 1;
+            #end if-statement
             continue
         #end if-statement
 
-        log_mu = np.log(mu);
-        #logfac_n=getLogFac(n); 
-        #above can be replaced with SciPy's function: 
-        logfac_n = scipy.special.gammaln(n+1);
+        if statsRNG is not None:
+            statsRNG['numbTestFull'] += 1;
+        #end if-statement
+
+        logfac_n = getLogFac(n);
 
         #two sides of an inequality condition
         lhs = np.log(V * one_over_alpha / (a/us/us + b));
@@ -66,6 +97,10 @@ def funPoissonLargePTRS(mu):
 
         if lhs <= rhs:
             result_n = n;
+            if statsRNG is not None:
+                statsRNG['numbAcceptFull'] += 1;
+                statsRNG['numbSample'] += 1;
+            #end if-statement
             return result_n;
         else:
             continue
@@ -0,0 +1,112 @@
+# This code generates many Poisson variates (or simulates many Poisson
+# variables) at once using a method designed for large (>10) Poisson
+# parameter values.
+#
+# The generation method is Algorthm PTRS, a type of rejection method, from
+# the paper:
+#
+# 1993 - Hörmann - "The transformed rejection method for generating Poisson
+# random variables"
+#
+# This is a vectorized (or batch) version of funPoissonLargePTRS. The steps
+# of the rejection method are run on whole arrays, and only the variates
+# that were rejected are generated again, until all variates are accepted.
+#
+# WARNING: This code is for illustration purposes only.
+#
+# In practice, you should *always* use the built-in NumPy function
+# random.poisson, which (for large Poisson parameter) uses Algorithm PTRS in the
+# above paper.
+#
+# INPUT:
+# mu is a single Poisson parameter (or mean) or an array of Poisson
+# parameters such that mu>=10.
+# numbSim is the number of variates (None to use the size of mu).
+# rng is a random number generator (None to use np.random).
+# constMu are the constants (from funConstPTRS) for mu (None to calculate them).
+# statsRNG is a dictionary of counters from funStatsRejection (None for no
+# counting), which is updated with the work done (see funStatsRejection.py).
+# OUTPUT:
+# result_n is an array of Poisson variates (that is, instances of Poisson
+# random variables), which are non-negative integers.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from getLogFac import getLogFac # type: ignore
+from funPoissonLargePTRS import funConstPTRS # type: ignore
+
+def funPoissonLargePTRSBatch(mu, numbSim=None, rng=None, constMu=None, statsRNG=None):
+    if rng is None:
+        rng = np.random;
+    #end if-statement
+    mu = np.asarray(mu, dtype=float).ravel() if np.ndim(mu) > 0 else np.asarray(mu, dtype=float);
+    if numbSim is None:
+        numbSim = mu.size;
+    #end if-statement
+
+    #precalculate some Poisson-parameter-dependent numbers
+    if constMu is None:
+        constMu = funConstPTRS(mu);
+    #end if-statement
+    mu = np.broadcast_to(mu, (numbSim,));
+    b, a, vr, one_over_alpha, log_mu = (np.broadcast_to(constTemp, (numbSim,)) for constTemp in constMu);
+
+    result_n = np.full(numbSim, -1, dtype=np.int64); #initialize the Poisson variates
+    indexPending = np.arange(numbSim); #variates not yet accepted
+    #Steps 1 to 3.1 in Algorithm PTRS (for all pending variates)
+    while (indexPending.size > 0):
+        mu_p = mu[indexPending];
+        a_p = a[indexPending];
+        b_p = b[indexPending];
+        numbPending = indexPending.size;
+
+        #generate two uniform variables
+        U = rng.uniform(0, 1, numbPending);
+        V = rng.uniform(0, 1, numbPending);
+
+        U = U - 0.5;
+        us = 0.5 - abs(U);
+
+        n = np.floor((2 * a_p / us + b_p) * U + mu_p + 0.43);
+
+        #quick acceptance (ie squeeze)
+        booleAccept = (us >= 0.07) & (V <= vr[indexPending]);
+        #quick rejection (the paper rejects negative n)
+        booleReject = (n < 0) | ((us < 0.013) & (V > us));
+        booleTest = ~(booleAccept | booleReject);
+        if statsRNG is not None:
+            statsRNG['numbIteration'] += 1;
+            statsRNG['numbCandidate'] += numbPending;
+            statsRNG['numbUniform'] += 2*numbPending;
+            statsRNG['numbAcceptSqueeze'] += int(np.sum(booleAccept));
+            statsRNG['numbRejectQuick'] += int(np.sum(booleReject & ~booleAccept));
+            statsRNG['numbTestFull'] += int(np.sum(booleTest));
+        #end if-statement
+
+        if np.any(booleTest):
+            n_t = n[booleTest];
+            us_t = us[booleTest];
+            #log factorial n (for the variates needing the full test)
+            logfac_n = getLogFac(n_t);
+
+            #two sides of an inequality condition
+            lhs = np.log(V[booleTest] * one_over_alpha[indexPending[booleTest]] / (a_p[booleTest]/us_t/us_t + b_p[booleTest]));
+            rhs = -mu_p[booleTest] + n_t * log_mu[indexPending[booleTest]] - logfac_n;
+            booleAccept[booleTest] = (lhs <= rhs);
+            if statsRNG is not None:
+                statsRNG['numbAcceptFull'] += int(np.sum(lhs <= rhs));
+            #end if-statement
+        #end if-statement
+
+        result_n[indexPending[booleAccept]] = n[booleAccept];
+        indexPending = indexPending[~booleAccept]; #re-generate rejected variates
+    #end while-loop
+    if statsRNG is not None:
+        statsRNG['numbSample'] += numbSim;
+    #end if-statement
+
+    return result_n;
+#end function
@@ -0,0 +1,79 @@
+# This code generates Poisson variates (or simulates Poisson variables) for
+# an array of Poisson parameters (or means) mu, which can range over many
+# orders of magnitude (eg from 0.01 to 10^5).
+#
+# The values of mu are divided into regimes, and each regime is simulated
+# with a suitable method in a single vectorized (or batch) step:
+# mu<muSmall -- the direct method (see funPoissonDirectBatch.py in the folder
+# PoissonDirect), where exponential variables are added until their sum
+# exceeds one;
+# muSmall<=mu<muPA -- Algorithm PTRS (see funPoissonLargePTRSBatch.py);
+# mu>=muPA -- Algorithm PA (see funPoissonLargePABatch.py), which is used
+# only if muPA is finite (by default, PTRS is used for all large mu).
+#
+# The variates of each regime are then placed back in the order of mu.
+#
+# INPUT:
+# mu is an array of Poisson parameters such that mu>=0.
+# rng is a random number generator (None to use np.random).
+# muSmall is the cut-off between the direct method and Algorithm PTRS.
+# muPA is the cut-off between Algorithm PTRS and Algorithm PA.
+# statsRNG is a dictionary (None for no counting) with a dictionary of
+# counters from funStatsRejection for each regime, under the keys 'direct',
+# 'PTRS' and 'PA', which are created (if missing) when the regime is used.
+# The counters of different methods are kept apart, as they count different
+# work (eg the direct method has no rejection tests).
+# OUTPUT:
+# result_n is an array (with the shape of mu) of Poisson variates.
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+from funPoissonLargePTRSBatch import funPoissonLargePTRSBatch # type: ignore
+from funPoissonLargePABatch import funPoissonLargePABatch # type: ignore
+from funStatsRejection import funStatsRejection # type: ignore
+import sys, os  # for finding the code in the PoissonDirect folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonDirect'));
+from funPoissonDirectBatch import funPoissonDirectBatch # type: ignore
+
+def funPoissonMixed(mu, rng=None, muSmall=10, muPA=np.inf, statsRNG=None):
+    if rng is None:
+        rng = np.random;
+    #end if-statement
+    mu = np.asarray(mu, dtype=float);
+    muFlat = mu.ravel();
+    result_n = np.zeros(muFlat.size, dtype=np.int64);
+
+    #partition mu values into regimes
+    indexSmall = np.flatnonzero(muFlat < muSmall);
+    indexPTRS = np.flatnonzero((muFlat >= muSmall) & (muFlat < muPA));
+    indexPA = np.flatnonzero(muFlat >= max(muPA, muSmall));
+
+    #counters of a regime (created when first needed)
+    def funStatsRegime(keyRegime):
+        if statsRNG is None:
+            return None;
+        #end if-statement
+        if keyRegime not in statsRNG:
+            statsRNG[keyRegime] = funStatsRejection();
+        #end if-statement
+        return statsRNG[keyRegime];
+
+    #simulate each regime in one step and scatter results back
+    if (indexSmall.size > 0):
+        result_n[indexSmall] = funPoissonDirectBatch(muFlat[indexSmall], rng=rng,
+                                                     statsRNG=funStatsRegime('direct'));
+    #end if-statement
+    if (indexPTRS.size > 0):
+        result_n[indexPTRS] = funPoissonLargePTRSBatch(muFlat[indexPTRS], rng=rng,
+                                                       statsRNG=funStatsRegime('PTRS'));
+    #end if-statement
+    if (indexPA.size > 0):
+        result_n[indexPA] = funPoissonLargePABatch(muFlat[indexPA], rng=rng,
+                                                   statsRNG=funStatsRegime('PA'));
+    #end if-statement
+
+    return result_n.reshape(mu.shape);
+#end function
@@ -0,0 +1,58 @@
+# This code records and summarizes how much work a rejection method for
+# generating Poisson variates does, such as Algorithm PTRS or Algorithm PA
+# (or the direct method in the folder PoissonDirect).
+#
+# The counters are kept in a dictionary statsRNG, which is given (as an
+# optional argument) to the Poisson generating functions, and is then
+# updated by every call, so the counters are aggregated over many calls
+# (or a batch of variates). The counters are:
+# numbSample -- number of variates generated;
+# numbIteration -- number of iterations of the (while) loop;
+# numbCandidate -- number of candidate variates;
+# numbUniform -- number of uniform variables used;
+# numbAcceptSqueeze -- number of candidates accepted by a quick test (squeeze);
+# numbRejectQuick -- number of candidates rejected by a quick test;
+# numbTestFull -- number of candidates needing the full test (log factorials);
+# numbAcceptFull -- number of candidates accepted by the full test.
+#
+# Methods without rejection (eg the direct and inverse methods in the folder
+# PoissonDirect) have one candidate per variate and no tests, so they only
+# update numbSample, numbIteration, numbCandidate and numbUniform. As
+# different methods count different work, funPoissonMixed.py keeps separate
+# counters for each method (or regime).
+#
+# EXAMPLE:
+# statsRNG=funStatsRejection();
+# X=funPoissonLargePTRSBatch(mu,numbSim,statsRNG=statsRNG);
+# summaryStats=funStatsSummary(statsRNG); #includes acceptance rates
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+# create dictionary of counters (all zero)
+def funStatsRejection():
+    statsRNG = {'numbSample': 0, 'numbIteration': 0, 'numbCandidate': 0, 'numbUniform': 0,
+                'numbAcceptSqueeze': 0, 'numbRejectQuick': 0, 'numbTestFull': 0,
+                'numbAcceptFull': 0};
+    return statsRNG;
+#end function
+
+# summary of counters with rates (per candidate or per variate)
+def funStatsSummary(statsRNG, booleDisplay=False):
+    numbSample = max(statsRNG['numbSample'], 1);
+    numbCandidate = max(statsRNG['numbCandidate'], 1);
+    summaryStats = dict(statsRNG);
+    summaryStats['rateAccept'] = statsRNG['numbSample'] / numbCandidate; #acceptance rate
+    summaryStats['rateSqueeze'] = statsRNG['numbAcceptSqueeze'] / numbCandidate;
+    summaryStats['rateTestFull'] = statsRNG['numbTestFull'] / numbCandidate;
+    summaryStats['candidatesPerSample'] = statsRNG['numbCandidate'] / numbSample;
+    summaryStats['uniformsPerSample'] = statsRNG['numbUniform'] / numbSample;
+
+    if booleDisplay:
+        for keyStats, valueStats in summaryStats.items():
+            print(keyStats + ' = ' + str(valueStats));
+        #end for-loop
+    #end if-statement
+    return summaryStats;
+#end function
@@ -1,26 +1,56 @@
+# This code calculates the logarithm of factorials, log(k!), for a single
+# non-negative integer k or an array of them.
+#
+# Values of k below the threshold kThreshold are read from a table, which
+# is calculated once (for each threshold) and then cached. Values of k at or
+# above the threshold use SciPy's gammaln function, as log(k!)=gammaln(k+1).
+#
+# The table is only faster than gammaln for arrays of (roughly) 1000 or more
+# values (eg in funPoissonLargePTRSBatch.py), where it is two to three times
+# faster for k below the threshold. Single values (eg in
+# funPoissonLargePTRS.py) and smaller arrays always use gammaln. For large k,
+# the Stirling series (with a few terms) is not faster than gammaln, so it is
+# not used.
+#
 # Author: H. Paul Keeler, 2019.
 # Website: hpaulkeeler.com
 # Repository: github.com/hpaulkeeler/posts
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
 import scipy 
+from functools import lru_cache  # for caching tables
 
-#helper function
-def getLogFac(k):
-    logfac_k=scipy.special.gammaln(k+1); #can be replaced with the method below
+#table of log(k!) values for k=0 to kThreshold-1
+@lru_cache(maxsize=8)
+def getLogFacTable(kThreshold):
+    values_logfac=scipy.special.gammaln(np.arange(kThreshold)+1);
+    values_logfac.flags.writeable=False; #table is shared, so make read-only
+    return values_logfac;
 
-    # # NOTE if no function for calculating log of factorials exist, use
-    # # approximation below.
+#helper function
+def getLogFac(k, kThreshold=256, numbTableMin=1000):
+    if isinstance(k, (int, float, np.number)):
+        #single value
+        return scipy.special.gammaln(k+1);
+    #end if-statement
+    k=np.asarray(k);
+    if (k.size<numbTableMin):
+        #few values, so the table is not faster
+        return scipy.special.gammaln(k+1);
+    #end if-statement
 
-    # #pre-calculated logfac_k values for k=0 to 10
-    # values_logfac=np.array([0,0,0.693147180559945,1.791759469228055,3.178053830347946,\
-    #     4.787491742782046,6.579251212010101,8.525161361065415,10.604602902745251,\
-    #     12.801827480081469,15.104412573075516]);
-    
-    # if (k<=10):        
-    #     logfac_k=values_logfac[int(k[0])]; 
-    # else:    
-    #     logfac_k = np.log(np.sqrt(2 * np.pi))+(k + 0.5)* np.log(k) -k + (1/12 - 1/(360 * k**2))/k;    
-    # #end if-statement
-    
+    booleTable=(k<kThreshold);
+    if not booleTable.any():
+        #all values from gammaln
+        return scipy.special.gammaln(k+1);
+    #end if-statement
+    values_logfac=getLogFacTable(kThreshold);
+    if booleTable.all():
+        #all values from table
+        return values_logfac[k.astype(np.int64)];
+    #end if-statement
+    #use table for small k and gammaln for large k
+    logfac_k=np.empty(k.shape);
+    logfac_k[booleTable]=values_logfac[k[booleTable].astype(np.int64)];
+    logfac_k[~booleTable]=scipy.special.gammaln(k[~booleTable]+1);
     return logfac_k
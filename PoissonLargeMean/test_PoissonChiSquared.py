@@ -0,0 +1,44 @@
+# Tests for PoissonChiSquared.py (run with pytest).
+#
+# Author: H. Paul Keeler, 2026.
+# Website: hpaulkeeler.com
+# Repository: github.com/hpaulkeeler/posts
+
+import os, sys  # for finding the code in this folder
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)));
+import numpy as np;  # NumPy package for arrays, random number generation, etc
+import warnings  # for checking warnings
+from PoissonChiSquared import PoissonChiSquared # type: ignore
+
+# very small mu leaves (at most) a few bins after merging, so often no
+# degrees of freedom, which must not give a (certain) rejection
+def test_chi_squared_few_bins():
+    numbTest = 0;
+    numbReject = 0;
+    for seedRand in range(100):
+        testChiSquared = PoissonChiSquared();
+        testChiSquared.update(np.random.default_rng(seedRand).poisson(0.01, 10**5));
+        with warnings.catch_warnings(record=True) as warningsAll:
+            warnings.simplefilter('always');
+            statChiSquare, pValue = testChiSquared.getTest(ddof=1);
+        #end with-statement
+        if np.isnan(pValue):
+            assert np.isnan(statChiSquare) and (len(warningsAll) == 1);
+        else:
+            numbTest = numbTest + 1;
+            numbReject = numbReject + (pValue < 0.05);
+        #end if-statement
+    #end for-loop
+    assert numbTest < 100;  # some samples have no test
+    assert numbReject <= max(2, 0.15 * numbTest);
+
+def test_chi_squared_poisson_samples():
+    numbReject = 0;
+    for seedRand in range(20):
+        testChiSquared = PoissonChiSquared();
+        testChiSquared.update(np.random.default_rng(seedRand).poisson(30, 10**5));
+        _, pValue = testChiSquared.getTest(ddof=1);
+        assert 0 <= pValue <= 1;
+        numbReject = numbReject + (pValue < 0.05);
+    #end for-loop
+    assert numbReject <= 4;
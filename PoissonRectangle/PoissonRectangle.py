@@ -7,6 +7,9 @@
 
 import numpy as np;  # NumPy package for arrays, random number generation, etc
 import matplotlib.pyplot as plt  # for plotting
+import sys, os  # for finding the code in the PoissonFast folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonFast'));
+from funMortonSort import funMortonSort # type: ignore
 
 plt.close('all');  # close all figures
 
@@ -23,10 +26,19 @@ areaTotal = xDelta * yDelta; #area of rectangle
 # Point process parameters
 lambda0 = 100;  # intensity (ie mean density) of the Poisson process
 
+# data type of coordinates -- np.float32 (single precision) halves the memory
+dtypeCoord = np.float64;
+rng = np.random.default_rng();  # random number generator (supports dtype)
+booleSortMorton = False;  # set to True to sort points along a Z-order curve
+
 # Simulate a Poisson point process
-numbPoints = np.random.poisson(lambda0 * areaTotal);  # Poisson number of points
-xx = xDelta * np.random.uniform(0, 1, numbPoints) + xMin;  # x coordinates of Poisson points
-yy = yDelta * np.random.uniform(0, 1, numbPoints) + yMin;  # y coordinates of Poisson points
+numbPoints = rng.poisson(lambda0 * areaTotal);  # Poisson number of points
+xx = xDelta * rng.random(numbPoints, dtype=dtypeCoord) + xMin;  # x coordinates of Poisson points
+yy = yDelta * rng.random(numbPoints, dtype=dtypeCoord) + yMin;  # y coordinates of Poisson points
+
+if booleSortMorton:
+    # sort points so nearby points are nearby in memory (eg for k-d trees)
+    xx, yy = funMortonSort(xx, yy, [xMin, xMax, yMin, yMax]);
 
 # Plotting
 plt.scatter(xx, yy, edgecolor='b', facecolor='none', alpha=0.5);
@@ -14,6 +14,9 @@ import numpy.matlib
 from numpy.random import RandomState
 import matplotlib.pyplot as plt  # for plotting
 from matplotlib.patches import Rectangle  # for drawing rectangles
+import sys, os  # for finding the code in the PoissonFast folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PoissonFast'));
+from EnsembleStore import EnsembleWriter # type: ignore
 
 plt.close('all')  # close all figures
 
@@ -23,6 +26,8 @@ boolePlot=1; #set to 1 to plot street layout, 0 for no plot
 
 choiceTile=1; #1 tile a single realization; 2 tile the random point process
 numbWrap=1; #number tiles tiles are wrapped around centre tile
+booleSave=0; #set to 1 to save the tiled point patterns to disk
+pathStore='PoissonTiledStore'; #folder for saving the point patterns
 
 #Poisson point process parameter
 lambdaS=5   ; #intensity (ie mean density) of the Poisson point process
@@ -58,6 +63,13 @@ else:
 numbSide=(2*numbWrap+1); #width of tiling (ie number of tiles across)
 numbTile=numbSide**2; #total number of tiles
 
+if booleSave:
+    #each tile is saved as an ensemble (see PoissonFast/EnsembleStore.py)
+    dictParam={'windowSim':[xMin,xMax,yMin,yMax],'lambda0':lambdaS,
+               'seedRand':int(seedRandS),'choiceTile':choiceTile,'numbWrap':numbWrap};
+    writerStore=EnsembleWriter(pathStore,dictParam);
+#end if statemenet
+
 for ss in range(numbSimS):
     #loop through each simulation
     
@@ -151,4 +163,12 @@ for ss in range(numbSimS):
     xxTiled=np.concatenate(xxTiledCell).flatten();
     yyTiled=np.concatenate(yyTiledCell).flatten();
     ###END - Tile point process by shifting x/y values - END###    
-#end for-loop
\ No newline at end of file
+    
+    if booleSave:
+        writerStore.append(np.ravel(numbPoints),xxTiled,yyTiled);
+    #end if statemenet
+#end for-loop
+
+if booleSave:
+    writerStore.close();
+#end if statemenet
\ No newline at end of file
@@ -21,6 +21,10 @@ lambdaParent = 10;  # density of parent Poisson point process
 lambdaDaughter = 100;  # mean number of points in each cluster
 sigma = 0.05;  # sigma for normal variables (ie random locations) of daughters
 
+# data type of coordinates -- np.float32 (single precision) halves the memory
+dtypeCoord = np.float64;
+rng = np.random.default_rng();  # random number generator (supports dtype)
+
 # Extended simulation windows parameters
 rExt=6*sigma; # extension parameter 
 # for rExt, use factor of deviation sigma eg 5 or 6
@@ -34,19 +38,19 @@ yDeltaExt = yMaxExt - yMinExt;
 areaTotalExt = xDeltaExt * yDeltaExt;  # area of extended rectangle
 
 # Simulate Poisson point process for the parents
-numbPointsParent = np.random.poisson(areaTotalExt * lambdaParent);# Poisson number of points
+numbPointsParent = rng.poisson(areaTotalExt * lambdaParent);# Poisson number of points
 # x and y coordinates of Poisson points for the parent
-xxParent = xMinExt + xDeltaExt * np.random.uniform(0, 1, numbPointsParent);
-yyParent = yMinExt + yDeltaExt * np.random.uniform(0, 1, numbPointsParent);
+xxParent = xMinExt + xDeltaExt * rng.random(numbPointsParent, dtype=dtypeCoord);
+yyParent = yMinExt + yDeltaExt * rng.random(numbPointsParent, dtype=dtypeCoord);
 
 # Simulate Poisson point process for the daughters (ie final poiint process)
-numbPointsDaughter = np.random.poisson(lambdaDaughter, numbPointsParent);
+numbPointsDaughter = rng.poisson(lambdaDaughter, numbPointsParent);
 numbPoints = sum(numbPointsDaughter);  # total number of points
 
 # Generate the (relative) locations in Cartesian coordinates by
 # simulating independent normal variables
-xx0 = np.random.normal(0, sigma, numbPoints);  # (relative) x coordinaets
-yy0 = np.random.normal(0, sigma, numbPoints);  # (relative) y coordinates
+xx0 = sigma * rng.standard_normal(numbPoints, dtype=dtypeCoord);  # (relative) x coordinaets
+yy0 = sigma * rng.standard_normal(numbPoints, dtype=dtypeCoord);  # (relative) y coordinates
 
 # replicate parent points (ie centres of disks/clusters)
 xx = np.repeat(xxParent, numbPointsDaughter);